@@ -1,13 +1,16 @@
 require('dotenv').config();
-const axios = require('axios');
 
 // Import configuration
 const { GITHUB_USERNAME, BASE_URL } = require('../config/config');
 const {
-  attachRateLimitLogger,
+  createGitHubClient,
   withRateLimitRetry,
-  keepAliveAgent,
+  getNextPageUrl,
+  getWithEtag,
+  postGraphql,
+  mapWithConcurrency,
 } = require('../utils/http-helpers');
+const { parseRepositoryUrl } = require('../utils/github-helpers');
 const { isCommitByUser } = require('../utils/commit-helpers');
 
 /**
@@ -24,6 +27,85 @@ async function getGitHubJoinYear(axiosInstance) {
   }
 }
 
+/**
+ * The searches run for every year, in the order the year loop destructures
+ * them. `range` is that year's `start..end` window.
+ */
+const YEARLY_SEARCHES = [
+  // Merged PRs
+  (user, range) => `is:pr author:${user} is:merged merged:${range}`,
+  // Issues
+  (user, range) => `is:issue author:${user} -user:${user} created:${range}`,
+  // Reviewed PRs: reviewed, merged, or closed-with-a-comment by the user
+  (user, range) => `is:pr reviewed-by:${user} -author:${user} updated:${range}`,
+  (user, range) => `is:pr merged-by:${user} -author:${user} updated:${range}`,
+  (user, range) =>
+    `is:pr is:closed -author:${user} closed-by:${user} commenter:${user} closed:${range}`,
+  // Collaborations
+  (user, range) => `is:pr commenter:${user} -author:${user} -reviewed-by:${user} updated:${range}`,
+  (user, range) => `is:issue commenter:${user} -author:${user} updated:${range}`,
+];
+
+const MS_PER_DAY = 1000 * 60 * 60 * 24;
+
+/** Whole days from `from` to `to`, as every period column reports them. */
+function daysBetween(from, to) {
+  return Math.round((new Date(to) - new Date(from)) / MS_PER_DAY);
+}
+
+// --- Entry builders ---
+// Each contribution type has one shape, built in one place, whichever search
+// the item came from.
+
+function baseEntry(item, repo) {
+  return { title: item.title, url: item.html_url, repo };
+}
+
+function collaborationEntry(item, repo, firstCommentDate) {
+  return {
+    ...baseEntry(item, repo),
+    date: firstCommentDate,
+    createdAt: item.created_at,
+    firstCommentedAt: firstCommentDate,
+    state: item.state,
+    mergedAt: item.pull_request?.merged_at || null,
+    closedAt: item.state === 'closed' ? item.closed_at : null,
+    updatedAt: item.updated_at,
+  };
+}
+
+function coAuthoredEntry(item, repo, commitDetails, mergedAt) {
+  const daysDiff = daysBetween(item.created_at, commitDetails.firstCommitDate);
+  return {
+    ...baseEntry(item, repo),
+    date: commitDetails.firstCommitDate,
+    createdAt: item.created_at,
+    firstCommitDate: commitDetails.firstCommitDate,
+    firstCommitPeriod: daysDiff + (daysDiff === 1 ? ' day' : ' days'),
+    commitCount: commitDetails.commitCount,
+    mergedAt,
+    state: item.state,
+  };
+}
+
+function reviewedEntry(item, repo, myFirstReviewDate, mergedAt) {
+  const mergePeriod = mergedAt
+    ? daysBetween(item.created_at, mergedAt) + ' days'
+    : item.state === 'closed'
+      ? 'Closed'
+      : 'Open';
+  return {
+    ...baseEntry(item, repo),
+    date: item.updated_at,
+    createdAt: item.created_at,
+    mergedAt,
+    mergePeriod,
+    myFirstReviewDate,
+    myFirstReviewPeriod: daysBetween(item.created_at, myFirstReviewDate) + ' days',
+    state: item.state,
+  };
+}
+
 /**
  * Fetches all contribution data from the GitHub API for a given year range.
  */
@@ -31,7 +113,8 @@ async function fetchContributions(
   requestedStartYear,
   prCache,
   persistentCommitCache,
-  failedFetchCache
+  failedFetchCache,
+  persistentEtagCache
 ) {
   // Ensure the GitHub token is available from the environment variables.
   const token = process.env.GITHUB_TOKEN;
@@ -40,17 +123,7 @@ async function fetchContributions(
   }
 
   // Create an Axios instance with base URL and authentication headers.
-  const axiosInstance = attachRateLimitLogger(
-    axios.create({
-      baseURL: BASE_URL,
-      httpsAgent: keepAliveAgent,
-      timeout: 30000,
-      headers: {
-        Authorization: `token ${token}`,
-        Accept: 'application/vnd.github.v3+json',
-      },
-    })
-  );
+  const axiosInstance = createGitHubClient({ baseURL: BASE_URL, token });
 
   // --- AUTO-DISCOVERY LOGIC ---
   let startYear = requestedStartYear;
@@ -101,6 +174,11 @@ async function fetchContributions(
   // daily runs instead of re-attempted, until the monthly full sync wipes it.
   const permanentFailures = failedFetchCache instanceof Map ? failedFetchCache : new Map();
 
+  // ETag-keyed results of the per-PR reviews/comments lookups, mutated in place
+  // like the caches above. An unchanged PR revalidates with a free 304 instead
+  // of re-downloading (and re-paging through) its reviews or comments.
+  const etagCache = persistentEtagCache instanceof Map ? persistentEtagCache : new Map();
+
   /**
    * Records a PR/issue as permanently un-fetchable (confirmed non-rate-limit
    * 403 — see withRateLimitRetry). In-memory only; the caller persists this
@@ -125,48 +203,149 @@ async function fetchContributions(
   // added minutes of fixed waiting to a run that is otherwise sequential.
   const INTER_PAGE_DELAY_MS = 1000;
 
+  // How many of a year's search queries run at once, and how many PRs have
+  // their commits fetched at once. Both match the workbench's PR_CONCURRENCY:
+  // the Search API's secondary limit is far tighter than the core one. On the
+  // default HTTP/1.1 transport the shared agent's maxSockets also caps the
+  // socket count, but with GITHUB_HTTP2=true these two are the only ceiling.
+  const SEARCH_CONCURRENCY = 3;
+  const PR_CONCURRENCY = 3;
+
   /**
    * A helper function to fetch all pages for a given search query.
    */
   async function getAllPages(query) {
     let results = [];
     let page = 1;
-    while (true) {
-      const response = await withRateLimitRetry(
-        () => axiosInstance.get(`/search/issues?q=${query}&per_page=100&page=${page}`),
-        { label: `search p${page}`, assumeRateLimit: true }
-      );
+    let url = `/search/issues?q=${query}&per_page=100`;
+    while (url) {
+      const pageUrl = url;
+      const response = await withRateLimitRetry(() => axiosInstance.get(pageUrl), {
+        label: `search p${page}`,
+        assumeRateLimit: true,
+      });
       results.push(...response.data.items);
 
-      const linkHeader = response.headers.link;
-      if (linkHeader && linkHeader.includes('rel="next"')) {
+      url = getNextPageUrl(response);
+      if (url) {
         page++;
         await new Promise((resolve) => setTimeout(resolve, INTER_PAGE_DELAY_MS));
-      } else {
-        break;
       }
     }
     return results;
   }
 
+  // First-review dates resolved in bulk by prefetchFirstReviewDates, keyed by
+  // PR html_url. getPrMyFirstReviewDate reads from here before falling back to
+  // its own per-PR REST call, so only PRs the batch couldn't resolve pay one.
+  const prefetchedReviewDates = new Map();
+
+  // PRs per GraphQL review-date query. Each PR is one aliased field, so a batch
+  // is a single round-trip instead of one `/reviews` call per PR; 50 keeps the
+  // query comfortably under GitHub's node and complexity limits.
+  const REVIEW_DATE_BATCH_SIZE = 50;
+
+  /**
+   * Resolves the user's first review date for a list of search-result PRs via
+   * batched GraphQL queries and stores each verdict in prefetchedReviewDates
+   * (an ISO date, or null when the user never reviewed it). A field that fails
+   * with NOT_FOUND or FORBIDDEN gets the same verdict the REST path would give
+   * a 404 or a permanent 403; any other failure leaves the PR unresolved so
+   * getPrMyFirstReviewDate retries it over REST.
+   */
+  async function prefetchFirstReviewDates(prs, username, year) {
+    const pending = [];
+    const queued = new Set();
+    for (const pr of prs) {
+      if (queued.has(pr.html_url) || prefetchedReviewDates.has(pr.html_url)) continue;
+      if (permanentFailures.has(pr.html_url)) continue;
+      queued.add(pr.html_url);
+      pending.push({
+        ...parseRepositoryUrl(pr.repository_url),
+        number: pr.number,
+        url: pr.html_url,
+        title: pr.title,
+      });
+    }
+
+    for (let i = 0; i < pending.length; i += REVIEW_DATE_BATCH_SIZE) {
+      const batch = pending.slice(i, i + REVIEW_DATE_BATCH_SIZE);
+      const params = ['$login: String!'];
+      const fields = [];
+      const variables = { login: username };
+      batch.forEach((pr, idx) => {
+        params.push(`$o${idx}: String!`, `$r${idx}: String!`, `$n${idx}: Int!`);
+        fields.push(
+          `pr${idx}: repository(owner: $o${idx}, name: $r${idx}) { pullRequest(number: $n${idx}) { reviews(author: $login, first: 100) { nodes { submittedAt } } } }`
+        );
+        variables[`o${idx}`] = pr.owner;
+        variables[`r${idx}`] = pr.repo;
+        variables[`n${idx}`] = pr.number;
+      });
+
+      let result;
+      try {
+        result = await postGraphql(
+          axiosInstance,
+          `query(${params.join(', ')}) { ${fields.join(' ')} }`,
+          variables,
+          { label: `review-dates ${year} batch ${i / REVIEW_DATE_BATCH_SIZE + 1}` }
+        );
+      } catch (err) {
+        console.warn(`GraphQL review-date batch failed, falling back to REST: ${err.message}`);
+        continue;
+      }
+
+      const errorTypes = new Map();
+      for (const error of result.errors) {
+        const alias = error.path?.[0];
+        if (alias && !errorTypes.has(alias)) errorTypes.set(alias, error.type);
+      }
+
+      batch.forEach((pr, idx) => {
+        const alias = `pr${idx}`;
+        const errorType = errorTypes.get(alias);
+        if (errorType === 'FORBIDDEN') {
+          logPermanent403(pr.url, { hasLogged: false }, year, pr.title);
+          prefetchedReviewDates.set(pr.url, null);
+          return;
+        }
+        if (errorType === 'NOT_FOUND') {
+          prefetchedReviewDates.set(pr.url, null);
+          return;
+        }
+        const nodes = result.data[alias]?.pullRequest?.reviews?.nodes;
+        if (errorType || !nodes) return;
+
+        const submitted = nodes
+          .map((review) => review.submittedAt)
+          .filter(Boolean)
+          .sort((a, b) => new Date(a) - new Date(b));
+        prefetchedReviewDates.set(pr.url, submitted[0] || null);
+      });
+    }
+  }
+
   /**
    * Fetches the date of the user's first review on a given pull request.
    */
   async function getPrMyFirstReviewDate(owner, repo, prNumber, username, logState, year, title) {
     const url = `https://github.com/${owner}/${repo}/pull/${prNumber}`;
+    if (prefetchedReviewDates.has(url)) return prefetchedReviewDates.get(url);
     if (permanentFailures.has(url)) return null;
     try {
-      const response = await withRateLimitRetry(
-        () => axiosInstance.get(`/repos/${owner}/${repo}/pulls/${prNumber}/reviews`),
+      return await getWithEtag(
+        axiosInstance,
+        `/repos/${owner}/${repo}/pulls/${prNumber}/reviews`,
+        etagCache,
+        (response) => {
+          const myReviews = response.data
+            .filter((review) => review.user?.login === username)
+            .sort((a, b) => new Date(a.submitted_at) - new Date(b.submitted_at));
+          return myReviews.length > 0 ? myReviews[0].submitted_at : null;
+        },
         { label: `reviews#${prNumber}` }
       );
-      const myReviews = response.data
-        .filter((review) => review.user?.login === username)
-        .sort((a, b) => new Date(a.submitted_at) - new Date(b.submitted_at));
-      if (myReviews.length > 0) {
-        return myReviews[0].submitted_at;
-      }
-      return null;
     } catch (err) {
       if (err.isPermanent403) {
         logPermanent403(url, logState, year, title);
@@ -181,27 +360,39 @@ async function fetchContributions(
 
   /**
    * Fetches the date of the user's first comment on an issue or PR.
+   * `commentCount` is the search result's own `comments` field — the number
+   * of comments at `url` — so a thread the search already reports as empty
+   * is answered without a request.
    */
-  async function getFirstCommentDate(url, username, logState, year, title) {
+  async function getFirstCommentDate(url, username, logState, year, title, commentCount = null) {
+    if (commentCount === 0) return null;
     if (permanentFailures.has(url)) return null;
     try {
       let page = 1;
-      while (true) {
-        const response = await withRateLimitRetry(
-          () => axiosInstance.get(`${url}?per_page=100&page=${page}`),
+      let pageUrl = `${url}?per_page=100`;
+      while (pageUrl) {
+        const { firstCommentAt, nextUrl } = await getWithEtag(
+          axiosInstance,
+          pageUrl,
+          etagCache,
+          (response) => {
+            const myFirstComment = response.data.find(
+              (comment) => comment.user?.login === username
+            );
+            return {
+              firstCommentAt: myFirstComment ? myFirstComment.created_at : null,
+              nextUrl: getNextPageUrl(response),
+            };
+          },
           { label: `comments p${page}` }
         );
-        const myFirstComment = response.data.find((comment) => comment.user?.login === username);
-        if (myFirstComment) {
-          return myFirstComment.created_at;
-        }
-        const linkHeader = response.headers.link;
-        if (linkHeader && linkHeader.includes('rel="next"')) {
-          page++;
-        } else {
-          return null;
+        if (firstCommentAt) {
+          return firstCommentAt;
         }
+        pageUrl = nextUrl;
+        page++;
       }
+      return null;
     } catch (err) {
       if (err.isPermanent403) {
         logPermanent403(url, logState, year, title);
@@ -253,20 +444,19 @@ async function fetchContributions(
 
     try {
       let page = 1;
+      let url = `${prUrlKey}/commits?per_page=100`;
       let allCommits = [];
-      while (true) {
-        const resp = await withRateLimitRetry(
-          () => axiosInstance.get(`${prUrlKey}/commits?per_page=100&page=${page}`),
-          { label: `commits#${prNumber} p${page}` }
-        );
+      while (url) {
+        const pageUrl = url;
+        const resp = await withRateLimitRetry(() => axiosInstance.get(pageUrl), {
+          label: `commits#${prNumber} p${page}`,
+        });
         allCommits.push(...resp.data);
 
-        const linkHeader = resp.headers.link;
-        if (linkHeader && linkHeader.includes('rel="next"')) {
+        url = getNextPageUrl(resp);
+        if (url) {
           page++;
           await new Promise((r) => setTimeout(r, 200));
-        } else {
-          break;
         }
       }
 
@@ -300,23 +490,67 @@ async function fetchContributions(
     return result;
   }
 
+  /**
+   * Fetches commit details for a batch of PRs in parallel so the sequential
+   * categorization loops below find them already in commitCache. Those loops
+   * have to stay sequential — their seenUrls/uniqueReviewedPrs bookkeeping
+   * depends on processing order — but the network calls they make don't.
+   */
+  async function prefetchCommitDetails(prs, year) {
+    // The reviewed-by/merged-by/closed-by searches overlap heavily; fetching a
+    // PR twice in the same chunk would race past the cache and pay double.
+    const uniquePrs = [...new Map(prs.map((pr) => [pr.html_url, pr])).values()];
+    await mapWithConcurrency(uniquePrs, PR_CONCURRENCY, (pr) => {
+      const { owner, repo } = parseRepositoryUrl(pr.repository_url);
+      return getFirstCommitDetails(
+        owner,
+        repo,
+        pr.number,
+        GITHUB_USERNAME,
+        commitCache,
+        pr.updated_at,
+        { hasLogged: false },
+        year,
+        pr.title,
+        pr.created_at
+      );
+    });
+  }
+
+  // Years stay sequential: cross-year dedupe (seenUrls) keeps the earliest
+  // year's record, and running every year's searches at once would blow
+  // straight through the Search API's per-minute budget.
   for (let year = startYear; year <= currentYear; year++) {
     console.log(`Fetching contributions for year: ${year}...`);
 
     const yearStart = `${year}-01-01T00:00:00Z`;
     const yearEnd = `${year + 1}-01-01T00:00:00Z`;
-
-    // Pull Requests
-    const prs = await getAllPages(
-      `is:pr author:${GITHUB_USERNAME} is:merged merged:${yearStart}..${yearEnd}`
+    const yearStartMs = Date.parse(yearStart);
+    const yearEndMs = Date.parse(yearEnd);
+    const updatedInYear = (pr) => {
+      const updatedMs = Date.parse(pr.updated_at);
+      return updatedMs >= yearStartMs && updatedMs < yearEndMs;
+    };
+
+    // Every search for the year is independent of the others, so they're
+    // fetched up front with bounded concurrency instead of one after another.
+    const [
+      prs,
+      issues,
+      reviewedByPrs,
+      mergedByPrs,
+      closedByPrs,
+      collaborationsPrs,
+      collaborationsIssues,
+    ] = await mapWithConcurrency(YEARLY_SEARCHES, SEARCH_CONCURRENCY, (buildQuery) =>
+      getAllPages(buildQuery(GITHUB_USERNAME, `${yearStart}..${yearEnd}`))
     );
 
+    // Pull Requests
     for (const pr of prs) {
       if (prCache.has(pr.html_url)) continue;
 
-      const repoParts = new URL(pr.repository_url).pathname.split('/');
-      const owner = repoParts[repoParts.length - 2];
-      const repoName = repoParts[repoParts.length - 1];
+      const { owner, repo: repoName } = parseRepositoryUrl(pr.repository_url);
 
       if (owner === GITHUB_USERNAME) {
         prCache.add(pr.html_url);
@@ -327,40 +561,25 @@ async function fetchContributions(
       if (seenUrls.pullRequests.has(pr.html_url)) continue;
 
       contributions.pullRequests.push({
-        title: pr.title,
-        url: pr.html_url,
-        repo: `${owner}/${repoName}`,
+        ...baseEntry(pr, `${owner}/${repoName}`),
         date: pr.pull_request.merged_at,
         mergedAt: pr.pull_request.merged_at,
         createdAt: pr.created_at,
-        reviewPeriod: Math.round(
-          (new Date(pr.pull_request.merged_at) - new Date(pr.created_at)) / (1000 * 60 * 60 * 24)
-        ),
+        reviewPeriod: daysBetween(pr.created_at, pr.pull_request.merged_at),
       });
       seenUrls.pullRequests.add(pr.html_url);
     }
 
     // Issues
-    const issues = await getAllPages(
-      `is:issue author:${GITHUB_USERNAME} -user:${GITHUB_USERNAME} created:${yearStart}..${yearEnd}`
-    );
     for (const issue of issues) {
       if (seenUrls.issues.has(issue.html_url)) continue;
-      const repoParts = new URL(issue.repository_url).pathname.split('/');
-      const owner = repoParts[repoParts.length - 2];
-      const repoName = repoParts[repoParts.length - 1];
+      const { owner, repo: repoName } = parseRepositoryUrl(issue.repository_url);
 
       const closingPeriod =
-        issue.state === 'closed'
-          ? Math.round(
-              (new Date(issue.closed_at) - new Date(issue.created_at)) / (1000 * 60 * 60 * 24)
-            )
-          : 'Open';
+        issue.state === 'closed' ? daysBetween(issue.created_at, issue.closed_at) : 'Open';
 
       contributions.issues.push({
-        title: issue.title,
-        url: issue.html_url,
-        repo: `${owner}/${repoName}`,
+        ...baseEntry(issue, `${owner}/${repoName}`),
         date: issue.created_at,
         closedAt: issue.closed_at,
         closingPeriod,
@@ -369,19 +588,23 @@ async function fetchContributions(
     }
 
     // Reviewed PRs
-    const reviewedByPrs = await getAllPages(
-      `is:pr reviewed-by:${GITHUB_USERNAME} -author:${GITHUB_USERNAME} updated:${yearStart}..${yearEnd}`
-    );
-    const mergedByPrs = await getAllPages(
-      `is:pr merged-by:${GITHUB_USERNAME} -author:${GITHUB_USERNAME} updated:${yearStart}..${yearEnd}`
-    );
-    const closedByPrs = await getAllPages(
-      `is:pr is:closed -author:${GITHUB_USERNAME} closed-by:${GITHUB_USERNAME} commenter:${GITHUB_USERNAME} closed:${yearStart}..${yearEnd}`
-    );
-
     const combinedResults = [...reviewedByPrs, ...mergedByPrs, ...closedByPrs];
     const uniqueReviewedPrs = new Set();
 
+    // Resolve first-review dates (in a handful of GraphQL round-trips) and
+    // commit details (in parallel) for every human PR the loop below will ask
+    // about, so the loop itself mostly reads from cache.
+    const humanReviewCandidates = combinedResults.filter((pr) => {
+      if (pr.private || pr.user?.type === 'Bot') return false;
+      const { owner } = parseRepositoryUrl(pr.repository_url);
+      if (owner === GITHUB_USERNAME) return false;
+      return updatedInYear(pr);
+    });
+    await Promise.all([
+      prefetchFirstReviewDates(humanReviewCandidates, GITHUB_USERNAME, year),
+      prefetchCommitDetails(humanReviewCandidates, year),
+    ]);
+
     for (const pr of combinedResults) {
       // 1. Private repo check
       if (pr.private) {
@@ -390,9 +613,7 @@ async function fetchContributions(
       }
 
       const isBot = pr.user && pr.user.type === 'Bot';
-      const repoParts = new URL(pr.repository_url).pathname.split('/');
-      const owner = repoParts[repoParts.length - 2];
-      const repoName = repoParts[repoParts.length - 1];
+      const { owner, repo: repoName } = parseRepositoryUrl(pr.repository_url);
 
       // 2. Logic for Bot PRs
       if (isBot) {
@@ -401,23 +622,15 @@ async function fetchContributions(
           GITHUB_USERNAME,
           { hasLogged: false },
           year,
-          pr.title
+          pr.title,
+          pr.comments
         );
 
         if (firstCommentDate) {
           if (!seenUrls.collaborations.has(pr.html_url)) {
-            contributions.collaborations.push({
-              title: pr.title,
-              url: pr.html_url,
-              repo: `${owner}/${repoName}`,
-              date: firstCommentDate,
-              createdAt: pr.created_at,
-              firstCommentedAt: firstCommentDate,
-              state: pr.state,
-              mergedAt: pr.pull_request?.merged_at || null,
-              closedAt: pr.state === 'closed' ? pr.closed_at : null,
-              updatedAt: pr.updated_at,
-            });
+            contributions.collaborations.push(
+              collaborationEntry(pr, `${owner}/${repoName}`, firstCommentDate)
+            );
             seenUrls.collaborations.add(pr.html_url);
           }
           continue;
@@ -434,19 +647,12 @@ async function fetchContributions(
       }
 
       // Logic for Human PRs (Note: redundant owner/repoName check removed)
-      const prDate = new Date(pr.updated_at);
-      if (prDate >= new Date(yearStart) && prDate < new Date(yearEnd)) {
+      if (updatedInYear(pr)) {
         let logState = { hasLogged: false };
 
         let mergedAt =
           pr.pull_request?.merged_at ||
           (pr.state === 'closed' && pr.merged_at ? pr.merged_at : null);
-        let mergePeriod = mergedAt
-          ? Math.round((new Date(mergedAt) - new Date(pr.created_at)) / (1000 * 60 * 60 * 24)) +
-            ' days'
-          : pr.state === 'closed'
-            ? 'Closed'
-            : 'Open';
 
         const commitDetails = await getFirstCommitDetails(
           owner,
@@ -462,22 +668,9 @@ async function fetchContributions(
         );
 
         if (commitDetails && commitDetails.firstCommitDate) {
-          const daysDiff = Math.round(
-            (new Date(commitDetails.firstCommitDate) - new Date(pr.created_at)) /
-              (1000 * 60 * 60 * 24)
+          contributions.coAuthoredPrs.push(
+            coAuthoredEntry(pr, `${owner}/${repoName}`, commitDetails, mergedAt)
           );
-          contributions.coAuthoredPrs.push({
-            title: pr.title,
-            url: pr.html_url,
-            repo: `${owner}/${repoName}`,
-            date: commitDetails.firstCommitDate,
-            createdAt: pr.created_at,
-            firstCommitDate: commitDetails.firstCommitDate,
-            firstCommitPeriod: daysDiff + (daysDiff === 1 ? ' day' : ' days'),
-            commitCount: commitDetails.commitCount,
-            mergedAt,
-            state: pr.state,
-          });
           seenUrls.coAuthoredPrs.add(pr.html_url);
         } else if (commitDetails && !commitDetails.fetchFailed) {
           rejectedCoAuthorUrls.add(pr.html_url);
@@ -493,42 +686,34 @@ async function fetchContributions(
           pr.title
         );
         if (myFirstReviewDate && !uniqueReviewedPrs.has(pr.html_url)) {
-          let myFirstReviewPeriod =
-            Math.round(
-              (new Date(myFirstReviewDate) - new Date(pr.created_at)) / (1000 * 60 * 60 * 24)
-            ) + ' days';
-          contributions.reviewedPrs.push({
-            title: pr.title,
-            url: pr.html_url,
-            repo: `${owner}/${repoName}`,
-            date: pr.updated_at,
-            createdAt: pr.created_at,
-            mergedAt,
-            mergePeriod,
-            myFirstReviewDate,
-            myFirstReviewPeriod,
-            state: pr.state,
-          });
+          contributions.reviewedPrs.push(
+            reviewedEntry(pr, `${owner}/${repoName}`, myFirstReviewDate, mergedAt)
+          );
           uniqueReviewedPrs.add(pr.html_url);
         }
       }
     }
 
     // Collaborations
-    const collaborationsPrs = await getAllPages(
-      `is:pr commenter:${GITHUB_USERNAME} -author:${GITHUB_USERNAME} -reviewed-by:${GITHUB_USERNAME} updated:${yearStart}..${yearEnd}`
-    );
-    const collaborationsIssues = await getAllPages(
-      `is:issue commenter:${GITHUB_USERNAME} -author:${GITHUB_USERNAME} updated:${yearStart}..${yearEnd}`
-    );
-
     const allCollaborations = [...collaborationsPrs, ...collaborationsIssues];
 
+    const humanCollaborationPrs = collaborationsPrs.filter((item) => {
+      if (item.user?.type === 'Bot' || seenUrls.collaborations.has(item.html_url)) return false;
+      const { owner } = parseRepositoryUrl(item.repository_url);
+      return owner !== GITHUB_USERNAME;
+    });
+    await Promise.all([
+      prefetchFirstReviewDates(
+        humanCollaborationPrs.filter((item) => !uniqueReviewedPrs.has(item.html_url)),
+        GITHUB_USERNAME,
+        year
+      ),
+      prefetchCommitDetails(humanCollaborationPrs, year),
+    ]);
+
     for (const item of allCollaborations) {
       const isBot = item.user && item.user.type === 'Bot';
-      const repoParts = new URL(item.repository_url).pathname.split('/');
-      const owner = repoParts[repoParts.length - 2];
-      const repoName = repoParts[repoParts.length - 1];
+      const { owner, repo: repoName } = parseRepositoryUrl(item.repository_url);
 
       if (seenUrls.collaborations.has(item.html_url) || owner === GITHUB_USERNAME) continue;
 
@@ -540,22 +725,14 @@ async function fetchContributions(
           GITHUB_USERNAME,
           logState,
           year,
-          item.title
+          item.title,
+          item.comments
         );
 
         if (firstCommentDate) {
-          contributions.collaborations.push({
-            title: item.title,
-            url: item.html_url,
-            repo: `${owner}/${repoName}`,
-            date: firstCommentDate,
-            createdAt: item.created_at,
-            firstCommentedAt: firstCommentDate,
-            state: item.state,
-            mergedAt: item.pull_request?.merged_at || null,
-            closedAt: item.state === 'closed' ? item.closed_at : null,
-            updatedAt: item.updated_at,
-          });
+          contributions.collaborations.push(
+            collaborationEntry(item, `${owner}/${repoName}`, firstCommentDate)
+          );
           seenUrls.collaborations.add(item.html_url);
         } else {
           prCache.add(item.html_url);
@@ -584,22 +761,9 @@ async function fetchContributions(
 
         if (commitDetails && commitDetails.firstCommitDate) {
           hasCommits = true;
-          const daysDiff = Math.round(
-            (new Date(commitDetails.firstCommitDate) - new Date(item.created_at)) /
-              (1000 * 60 * 60 * 24)
+          contributions.coAuthoredPrs.push(
+            coAuthoredEntry(item, `${owner}/${repoName}`, commitDetails, mergedAt)
           );
-          contributions.coAuthoredPrs.push({
-            title: item.title,
-            url: item.html_url,
-            repo: `${owner}/${repoName}`,
-            date: commitDetails.firstCommitDate,
-            createdAt: item.created_at,
-            firstCommitDate: commitDetails.firstCommitDate,
-            firstCommitPeriod: daysDiff + (daysDiff === 1 ? ' day' : ' days'),
-            commitCount: commitDetails.commitCount,
-            mergedAt,
-            state: item.state,
-          });
           seenUrls.coAuthoredPrs.add(item.html_url);
         } else if (commitDetails && !commitDetails.fetchFailed) {
           rejectedCoAuthorUrls.add(item.html_url);
@@ -619,29 +783,14 @@ async function fetchContributions(
         );
         if (myFirstReviewDate) {
           hasReview = true;
-          let mergedAt = item.pull_request.merged_at || null;
-          let mergePeriod = mergedAt
-            ? Math.round((new Date(mergedAt) - new Date(item.created_at)) / (1000 * 60 * 60 * 24)) +
-              ' days'
-            : item.state === 'closed'
-              ? 'Closed'
-              : 'Open';
-          let myFirstReviewPeriod =
-            Math.round(
-              (new Date(myFirstReviewDate) - new Date(item.created_at)) / (1000 * 60 * 60 * 24)
-            ) + ' days';
-          contributions.reviewedPrs.push({
-            title: item.title,
-            url: item.html_url,
-            repo: `${owner}/${repoName}`,
-            date: item.updated_at,
-            createdAt: item.created_at,
-            mergedAt,
-            mergePeriod,
-            myFirstReviewDate,
-            myFirstReviewPeriod,
-            state: item.state,
-          });
+          contributions.reviewedPrs.push(
+            reviewedEntry(
+              item,
+              `${owner}/${repoName}`,
+              myFirstReviewDate,
+              item.pull_request.merged_at || null
+            )
+          );
           uniqueReviewedPrs.add(item.html_url);
         }
       }
@@ -653,26 +802,18 @@ async function fetchContributions(
           GITHUB_USERNAME,
           logState,
           year,
-          item.title
+          item.title,
+          item.comments
+        );
+        contributions.collaborations.push(
+          collaborationEntry(item, `${owner}/${repoName}`, firstCommentDate)
         );
-        contributions.collaborations.push({
-          title: item.title,
-          url: item.html_url,
-          repo: `${owner}/${repoName}`,
-          date: firstCommentDate,
-          createdAt: item.created_at,
-          firstCommentedAt: firstCommentDate,
-          state: item.state,
-          mergedAt: item.pull_request?.merged_at || null,
-          closedAt: item.state === 'closed' ? item.closed_at : null,
-          updatedAt: item.updated_at,
-        });
       }
       seenUrls.collaborations.add(item.html_url);
     }
   }
 
-  return { contributions, prCache, commitCache, rejectedCoAuthorUrls };
+  return { contributions, prCache, commitCache, etagCache, rejectedCoAuthorUrls };
 }
 
 module.exports = {
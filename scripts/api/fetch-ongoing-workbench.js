@@ -1,12 +1,15 @@
 require('dotenv').config();
-const axios = require('axios');
 const { GITHUB_USERNAME, BASE_URL } = require('../config/config');
-const { getLinkedIssueNumbers, getPrActivityMeta } = require('../utils/github-helpers');
 const {
-  attachRateLimitLogger,
+  getLinkedIssueNumbers,
+  parseRepositoryUrl,
+  getPrActivityMeta,
+} = require('../utils/github-helpers');
+const {
+  createGitHubClient,
   withRateLimitRetry,
+  getNextPageUrl,
   mapWithConcurrency,
-  keepAliveAgent,
 } = require('../utils/http-helpers');
 const { isCommitByUser } = require('../utils/commit-helpers');
 
@@ -16,25 +19,16 @@ const { isCommitByUser } = require('../utils/commit-helpers');
 const token = process.env.GITHUB_TOKEN;
 if (!token) throw new Error('GITHUB_TOKEN is not set.');
 
-const axiosInstance = attachRateLimitLogger(
-  axios.create({
-    baseURL: BASE_URL,
-    httpsAgent: keepAliveAgent,
-    timeout: 30000,
-    headers: {
-      Authorization: `token ${token}`,
-      Accept: 'application/vnd.github.v3+json',
-    },
-  })
-);
+const axiosInstance = createGitHubClient({ baseURL: BASE_URL, token });
 
 // How many PRs to process concurrently per fetcher. Bounded (rather than
 // unlimited Promise.all) so we don't fire hundreds of simultaneous requests
 // at GitHub's secondary rate limiter when a user has thousands of open PRs
 // to track. Each PR's activity fetch fans out to 4 parallel calls, plus one
 // authoritative draft-state call (see fetchDraftState) = 5, so the real peak is
-// PR_CONCURRENCY * 5 sockets — kept at 3 (=> ~15 in flight, further capped by
-// the agent's maxSockets) to stay under GitHub's abuse-detection threshold.
+// PR_CONCURRENCY * 5 requests — kept at 3 (=> ~15 in flight, further capped
+// by the agent's maxSockets on the default HTTP/1.1 transport; the only cap
+// under GITHUB_HTTP2=true) to stay under GitHub's abuse-detection threshold.
 // Going higher reliably tripped secondary rate limits and ECONNRESET storms
 // that cost far more in backoff than the extra parallelism saved. The draft
 // call rides the same updated_at-gated cache, so it only fires when a PR
@@ -48,18 +42,18 @@ const PR_CONCURRENCY = 3;
 async function searchAll(query) {
   let results = [];
   let page = 1;
-  while (true) {
-    const response = await withRateLimitRetry(
-      () => axiosInstance.get(`/search/issues?q=${query}&per_page=100&page=${page}`),
-      { label: `search p${page}`, assumeRateLimit: true }
-    );
+  let url = `/search/issues?q=${query}&per_page=100`;
+  while (url) {
+    const pageUrl = url;
+    const response = await withRateLimitRetry(() => axiosInstance.get(pageUrl), {
+      label: `search p${page}`,
+      assumeRateLimit: true,
+    });
     results.push(...response.data.items);
-    const link = response.headers.link;
-    if (link && link.includes('rel="next"')) {
+    url = getNextPageUrl(response);
+    if (url) {
       page++;
       await new Promise((resolve) => setTimeout(resolve, 1000));
-    } else {
-      break;
     }
   }
   return results;
@@ -94,19 +88,18 @@ async function getFirstCommitDetails(
   let result = null;
   try {
     let page = 1;
+    let url = `${prUrlKey}/commits?per_page=100`;
     let allCommits = [];
-    while (true) {
-      const resp = await withRateLimitRetry(
-        () => axiosInstance.get(`${prUrlKey}/commits?per_page=100&page=${page}`),
-        { label: `commits#${prNumber} p${page}` }
-      );
+    while (url) {
+      const pageUrl = url;
+      const resp = await withRateLimitRetry(() => axiosInstance.get(pageUrl), {
+        label: `commits#${prNumber} p${page}`,
+      });
       allCommits.push(...resp.data);
-      const linkHeader = resp.headers.link;
-      if (linkHeader && linkHeader.includes('rel="next"')) {
+      url = getNextPageUrl(resp);
+      if (url) {
         page++;
         await new Promise((r) => setTimeout(r, 200));
-      } else {
-        break;
       }
     }
 
@@ -237,9 +230,7 @@ async function getCachedActivity(owner, repo, pr, activityCache, failedFetchCach
  * SHARED FORMATTER: formatTask
  */
 const formatTask = async (pr, status, activityCache, failedFetchCache) => {
-  const repoParts = new URL(pr.repository_url).pathname.split('/');
-  const owner = repoParts[repoParts.length - 2];
-  const repo = repoParts[repoParts.length - 1];
+  const { owner, repo } = parseRepositoryUrl(pr.repository_url);
 
   const activity = await getCachedActivity(owner, repo, pr, activityCache, failedFetchCache);
 
@@ -302,9 +293,7 @@ async function fetchOngoingReviews(activityCache, failedFetchCache) {
   // the task itself — reuse that single fetch instead of a third, separate
   // reviews/comments call per PR.
   const requestedTasks = await mapWithConcurrency(uniqueRequested, PR_CONCURRENCY, async (pr) => {
-    const repoParts = new URL(pr.repository_url).pathname.split('/');
-    const owner = repoParts[repoParts.length - 2];
-    const repo = repoParts[repoParts.length - 1];
+    const { owner, repo } = parseRepositoryUrl(pr.repository_url);
     const activity = await getCachedActivity(owner, repo, pr, activityCache, failedFetchCache);
     const status = activity.hasHumanEngagement ? 'Review in progress' : 'Request review';
     return formatTask(pr, status, activityCache, failedFetchCache);
@@ -329,11 +318,11 @@ async function fetchOngoingIssues(ongoingPrs = []) {
   return rawIssues
     .filter((issue) => !linkedIssueNumbers.has(issue.number))
     .map((issue) => {
-      const repoParts = new URL(issue.repository_url).pathname.split('/');
+      const { owner, repo } = parseRepositoryUrl(issue.repository_url);
       return {
         title: issue.title,
         url: issue.html_url,
-        repo: `${repoParts[repoParts.length - 2]}/${repoParts[repoParts.length - 1]}`,
+        repo: `${owner}/${repo}`,
         createdAt: issue.created_at,
         updatedAt: issue.updated_at,
         labels: issue.labels.map((l) => l.name),
@@ -348,31 +337,21 @@ async function fetchOngoingIssues(ongoingPrs = []) {
 async function fetchOngoingAuthoredPrs(activityCache, failedFetchCache) {
   let allAuthoredItems = [];
   let page = 1;
+  let url = '/issues?filter=created&state=open&per_page=100';
 
   try {
-    while (true) {
-      const response = await withRateLimitRetry(
-        () =>
-          axiosInstance.get(`/issues`, {
-            params: {
-              filter: 'created',
-              state: 'open',
-              per_page: 100,
-              page: page,
-            },
-          }),
-        { label: `authored-issues p${page}`, assumeRateLimit: true }
-      );
+    while (url) {
+      const pageUrl = url;
+      const response = await withRateLimitRetry(() => axiosInstance.get(pageUrl), {
+        label: `authored-issues p${page}`,
+        assumeRateLimit: true,
+      });
 
       if (response.data.length === 0) break;
       allAuthoredItems.push(...response.data);
 
-      const link = response.headers.link;
-      if (link && link.includes('rel="next"')) {
-        page++;
-      } else {
-        break;
-      }
+      url = getNextPageUrl(response);
+      page++;
     }
   } catch (err) {
     return [];
@@ -402,8 +381,7 @@ async function fetchOngoingCoAuthoredPrs(commitCache, activityCache, failedFetch
   const rawPrs = await searchAll(query);
 
   const candidates = rawPrs.filter((pr) => {
-    const repoParts = new URL(pr.repository_url).pathname.split('/');
-    const owner = repoParts[repoParts.length - 2];
+    const { owner } = parseRepositoryUrl(pr.repository_url);
     return owner !== GITHUB_USERNAME;
   });
 
@@ -420,9 +398,7 @@ async function fetchOngoingCoAuthoredPrs(commitCache, activityCache, failedFetch
   const examinedRejectedUrls = new Set();
 
   const results = await mapWithConcurrency(candidates, PR_CONCURRENCY, async (pr) => {
-    const repoParts = new URL(pr.repository_url).pathname.split('/');
-    const owner = repoParts[repoParts.length - 2];
-    const repoName = repoParts[repoParts.length - 1];
+    const { owner, repo: repoName } = parseRepositoryUrl(pr.repository_url);
 
     const commitDetails = await getFirstCommitDetails(
       owner,
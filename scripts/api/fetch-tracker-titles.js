@@ -19,32 +19,23 @@
  */
 const fs = require('fs/promises');
 const path = require('path');
-const axios = require('axios');
 const { BASE_URL } = require('../config/config');
 const { extractLinkedCodePr } = require('../utils/github-helpers');
 const {
-  attachRateLimitLogger,
+  createGitHubClient,
   withRateLimitRetry,
   mapWithConcurrency,
-  keepAliveAgent,
 } = require('../utils/http-helpers');
 
 const CACHE_FILE = path.join('data', 'tracker-titles-cache.json');
 const CONCURRENCY = 3;
 
 function buildAxiosInstance(timeoutMs) {
-  const token = process.env.GITHUB_TOKEN;
-  return attachRateLimitLogger(
-    axios.create({
-      baseURL: BASE_URL,
-      httpsAgent: keepAliveAgent,
-      timeout: timeoutMs,
-      headers: {
-        ...(token ? { Authorization: `token ${token}` } : {}),
-        Accept: 'application/vnd.github.v3+json',
-      },
-    })
-  );
+  return createGitHubClient({
+    baseURL: BASE_URL,
+    token: process.env.GITHUB_TOKEN,
+    timeout: timeoutMs,
+  });
 }
 
 async function readCache(cacheFile) {
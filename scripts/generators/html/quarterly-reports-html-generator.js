@@ -9,6 +9,7 @@ const {
   getIssueOrPrNumber,
   getPrStatusContent,
   getCollaborationStatusContent,
+  sortByDateDesc,
 } = require('../../utils/contribution-formatters');
 const {
   createNavHtml,
@@ -27,6 +28,7 @@ const {
   FAVICON_SVG_ENCODED,
 } = require('../../config/constants');
 const { sanitizeAttribute } = require('../../utils/html-helpers');
+const { writeFilesConcurrently } = require('../../utils/file-writer');
 const { getThemeInitScript, getThemeStyleVariant } = require('../../components/theme-init');
 
 // Status badge colors route straight through the theme engine's semantic
@@ -41,6 +43,98 @@ const STATUS_BADGE_TOKENS = {
 };
 const DEFAULT_STATUS_BADGE = { bg: 'var(--t-neutral-wash)', text: 'var(--t-neutral)' };
 
+// Configuration object defining each contribution section, including table headers, widths, and data types for sorting.
+// Shared by every quarter, so it's built once at module load.
+const SECTIONS = {
+  pullRequests: {
+    title: 'Merged PRs',
+    icon: LANDING_PAGE_ICONS.merged,
+    id: 'merged-prs',
+    headers: ['No.', 'Project', 'Title', 'Created', 'Merged', 'Review Period'],
+    widths: ['5%', '20%', '30%', '15%', '15%', '15%'],
+    colTypes: ['number', 'string', 'string', 'date', 'date', 'number'],
+    keys: ['repo', 'title', 'date', 'mergedAt', 'reviewPeriod'],
+  },
+  issues: {
+    title: 'Issues',
+    icon: LANDING_PAGE_ICONS.issues,
+    id: 'issues',
+    headers: ['No.', 'Project', 'Title', 'Created', 'Closed', 'Closing Period'],
+    widths: ['5%', '25%', '35%', '15%', '15%', '10%'],
+    colTypes: ['number', 'string', 'string', 'date', 'date', 'number'],
+    keys: ['repo', 'title', 'date', 'closedAt', 'closingPeriod'],
+  },
+  reviewedPrs: {
+    title: 'Reviewed PRs',
+    icon: LANDING_PAGE_ICONS.reviewed,
+    id: 'reviewed-prs',
+    headers: [
+      'No.',
+      'Project',
+      'Title',
+      'Created At',
+      'First Review',
+      'Review Period',
+      'Last Update / Status',
+    ],
+    widths: ['5%', '20%', '28%', '10%', '15%', '10%', '12%'],
+    colTypes: ['number', 'string', 'string', 'date', 'date', 'number', 'status'],
+    keys: ['repo', 'title', 'createdAt', 'myFirstReviewDate', 'myFirstReviewPeriod', 'date'],
+  },
+  coAuthoredPrs: {
+    title: 'Co-Authored PRs',
+    icon: LANDING_PAGE_ICONS.coAuthored,
+    id: 'co-authored-prs',
+    headers: [
+      'No.',
+      'Project',
+      'Title',
+      'Created At',
+      'First Commit',
+      'Commit Period',
+      'Last Update / Status',
+    ],
+    widths: ['5%', '15%', '25%', '10%', '12%', '13%', '20%'],
+    colTypes: ['number', 'string', 'string', 'date', 'date', 'number', 'status'],
+    keys: ['repo', 'title', 'createdAt', 'firstCommitDate', 'firstCommitPeriod', 'date'],
+  },
+  collaborations: {
+    title: 'Collaborations',
+    icon: LANDING_PAGE_ICONS.collaborations,
+    id: 'collaborations',
+    headers: ['No.', 'Project', 'Title', 'Created At', 'First Comment', 'Last Update / Status'],
+    widths: ['5%', '25%', '30%', '12%', '12%', '16%'],
+    colTypes: ['number', 'string', 'string', 'date', 'date', 'status'],
+    keys: ['repo', 'title', 'createdAt', 'firstCommentedAt', 'updatedAt'],
+  },
+};
+
+/**
+ * The opening of each section's table through `<tbody>`. Only the rows vary
+ * between quarters, so the header row is rendered once per section here.
+ *
+ * Sortable columns expose a real <button> so the sort is reachable and
+ * operable by keyboard, not just a click handler on a <th>; aria-sort on the
+ * <th> itself follows the WAI-ARIA sortable-table pattern and is kept in sync
+ * by table-filters.js as the sort state changes.
+ */
+const SECTION_TABLE_HEADS = Object.fromEntries(
+  Object.entries(SECTIONS).map(([section, { headers, colTypes }]) => {
+    const headerCells = headers.map((header, i) => {
+      const isStaticColumn = i === 0; // The 'No.' column is static (not sortable).
+      const thAttributes = isStaticColumn ? '' : `data-type="${colTypes[i]}" aria-sort="none" `;
+      const headerContent = isStaticColumn
+        ? header
+        : `<button type="button" class="th-sort-btn" title="Click to sort"><span class="th-content">${header}</span><span class="sort-icon" aria-hidden="true">↕</span></button>`;
+      return `<th ${thAttributes}scope="col" class="py-3 px-4" style="color:var(--t-brand)">${headerContent}</th>`;
+    });
+    return [
+      section,
+      `<table class="report-table min-w-full"><thead><tr>${headerCells.join('')}</tr></thead><tbody>`,
+    ];
+  })
+);
+
 /**
  * Supplements getReportStyleCss (shared, not owned by this generator) with
  * every rule this page needs that isn't already token-driven there: the
@@ -360,7 +454,7 @@ async function writeHtmlFiles(groupedContributions) {
    * repeating one.
    */
   function pickHighlights(pool, limit) {
-    const sorted = [...pool].sort((a, b) => new Date(b.date) - new Date(a.date));
+    const sorted = sortByDateDesc(pool, 'date');
     const picked = [];
     const seenRepos = new Set();
     for (const entry of sorted) {
@@ -534,27 +628,25 @@ async function writeHtmlFiles(groupedContributions) {
   // Pre-calculate the styles string to be included in the <style> tag.
   const dynamicCss = getReportStyleCss() + QUARTERLY_EXTRA_CSS;
 
+  // Pages are rendered first and written together at the end, so the writes
+  // overlap instead of each one waiting for the previous file to land.
+  const files = [];
+
   // Iterate over each quarterly report to generate its dedicated HTML file.
   for (let index = 0; index < allReports.length; index++) {
     const report = allReports[index];
-    const { key, year, quarterPrefix: quarter, data, totalContributions } = report;
+    const { year, quarterPrefix: quarter, data, totalContributions } = report;
     const footerHtml = createFooterHtml().trim();
 
     // Generate the navbar with path relative to the sub-folder
     const navHtmlForReports = createNavHtml('../');
 
     const yearDir = path.join(htmlBaseDir, year);
-    await fs.mkdir(yearDir, { recursive: true });
 
     const filename = `${quarter}-${year}.html`;
     const relativePath = path.join(year, filename);
     const filePath = path.join(yearDir, filename);
 
-    if (totalContributions === 0) {
-      console.log(`Skipping empty quarter: ${key}`);
-      continue;
-    }
-
     // Calculate repository statistics for the summary section.
     const allItems = [
       ...(data.pullRequests || []),
@@ -587,71 +679,6 @@ async function writeHtmlFiles(groupedContributions) {
     const coAuthoredPrCount = data.coAuthoredPrs?.length || '0';
     const collaborationCount = data.collaborations?.length || '0';
 
-    // Configuration object defining each contribution section, including table headers, widths, and data types for sorting.
-    const sections = {
-      pullRequests: {
-        title: 'Merged PRs',
-        icon: LANDING_PAGE_ICONS.merged,
-        id: 'merged-prs',
-        headers: ['No.', 'Project', 'Title', 'Created', 'Merged', 'Review Period'],
-        widths: ['5%', '20%', '30%', '15%', '15%', '15%'],
-        colTypes: ['number', 'string', 'string', 'date', 'date', 'number'],
-        keys: ['repo', 'title', 'date', 'mergedAt', 'reviewPeriod'],
-      },
-      issues: {
-        title: 'Issues',
-        icon: LANDING_PAGE_ICONS.issues,
-        id: 'issues',
-        headers: ['No.', 'Project', 'Title', 'Created', 'Closed', 'Closing Period'],
-        widths: ['5%', '25%', '35%', '15%', '15%', '10%'],
-        colTypes: ['number', 'string', 'string', 'date', 'date', 'number'],
-        keys: ['repo', 'title', 'date', 'closedAt', 'closingPeriod'],
-      },
-      reviewedPrs: {
-        title: 'Reviewed PRs',
-        icon: LANDING_PAGE_ICONS.reviewed,
-        id: 'reviewed-prs',
-        headers: [
-          'No.',
-          'Project',
-          'Title',
-          'Created At',
-          'First Review',
-          'Review Period',
-          'Last Update / Status',
-        ],
-        widths: ['5%', '20%', '28%', '10%', '15%', '10%', '12%'],
-        colTypes: ['number', 'string', 'string', 'date', 'date', 'number', 'status'],
-        keys: ['repo', 'title', 'createdAt', 'myFirstReviewDate', 'myFirstReviewPeriod', 'date'],
-      },
-      coAuthoredPrs: {
-        title: 'Co-Authored PRs',
-        icon: LANDING_PAGE_ICONS.coAuthored,
-        id: 'co-authored-prs',
-        headers: [
-          'No.',
-          'Project',
-          'Title',
-          'Created At',
-          'First Commit',
-          'Commit Period',
-          'Last Update / Status',
-        ],
-        widths: ['5%', '15%', '25%', '10%', '12%', '13%', '20%'],
-        colTypes: ['number', 'string', 'string', 'date', 'date', 'number', 'status'],
-        keys: ['repo', 'title', 'createdAt', 'firstCommitDate', 'firstCommitPeriod', 'date'],
-      },
-      collaborations: {
-        title: 'Collaborations',
-        icon: LANDING_PAGE_ICONS.collaborations,
-        id: 'collaborations',
-        headers: ['No.', 'Project', 'Title', 'Created At', 'First Comment', 'Last Update / Status'],
-        widths: ['5%', '25%', '30%', '12%', '12%', '16%'],
-        colTypes: ['number', 'string', 'string', 'date', 'date', 'status'],
-        keys: ['repo', 'title', 'createdAt', 'firstCommentedAt', 'updatedAt'],
-      },
-    };
-
     // Begin HTML structure for the report page.
     let htmlContent = dedent`
 <!DOCTYPE html>
@@ -700,34 +727,34 @@ ${navHtmlForReports}
           <div class="grid grid-cols-2 sm:grid-cols-3 lg:grid-cols-5 gap-4 text-sm">
             ${[
               {
-                id: sections.pullRequests.id,
+                id: SECTIONS.pullRequests.id,
                 count: prCount,
                 label: 'Merged PRs',
-                icon: sections.pullRequests.icon,
+                icon: SECTIONS.pullRequests.icon,
               },
               {
-                id: sections.issues.id,
+                id: SECTIONS.issues.id,
                 count: issueCount,
                 label: 'Issues',
-                icon: sections.issues.icon,
+                icon: SECTIONS.issues.icon,
               },
               {
-                id: sections.reviewedPrs.id,
+                id: SECTIONS.reviewedPrs.id,
                 count: reviewedPrCount,
                 label: 'Reviewed PRs',
-                icon: sections.reviewedPrs.icon,
+                icon: SECTIONS.reviewedPrs.icon,
               },
               {
-                id: sections.coAuthoredPrs.id,
+                id: SECTIONS.coAuthoredPrs.id,
                 count: coAuthoredPrCount,
                 label: 'Co-Authored PRs',
-                icon: sections.coAuthoredPrs.icon,
+                icon: SECTIONS.coAuthoredPrs.icon,
               },
               {
-                id: sections.collaborations.id,
+                id: SECTIONS.collaborations.id,
                 count: collaborationCount,
                 label: 'Collaborations',
-                icon: sections.collaborations.icon,
+                icon: SECTIONS.collaborations.icon,
               },
             ]
               .map(
@@ -762,18 +789,14 @@ ${navHtmlForReports}
     `;
 
     // Generate HTML for each contribution section (table).
-    for (const [section, sectionInfo] of Object.entries(sections)) {
+    for (const [section, sectionInfo] of Object.entries(SECTIONS)) {
       let items = data[section] || []; // Get data for the current section.
 
       // Apply initial chronological sort to Reviewed PRs and Co-Authored PRs for display consistency.
       if (section === 'reviewedPrs' && items && items.length > 0) {
-        items = [...items].sort(
-          (a, b) => new Date(b.myFirstReviewDate) - new Date(a.myFirstReviewDate)
-        );
+        items = sortByDateDesc(items, 'myFirstReviewDate');
       } else if (section === 'coAuthoredPrs' && items && items.length > 0) {
-        items = [...items].sort(
-          (a, b) => new Date(b.firstCommitDate) - new Date(a.firstCommitDate)
-        );
+        items = sortByDateDesc(items, 'firstCommitDate');
       }
 
       // Details tag is used for collapsible sections.
@@ -828,25 +851,8 @@ ${navHtmlForReports}
         // attributes, just no inserted whitespace between tags.
         let tableContent = `<div id="${sectionInfo.id}-scroll" class="overflow-x-auto rounded-lg border max-h-[70vh] overflow-y-auto" style="border-color: var(--t-line);">`;
         tableContent += `<!-- prettier-ignore -->`;
-        tableContent += `<table class="report-table min-w-full"><thead><tr>`;
-
-        // Generate table headers with sorting attributes (data-type). Sortable
-        // columns expose a real <button> so the sort is reachable and
-        // operable by keyboard, not just a click handler on a <th>; aria-sort
-        // on the <th> itself follows the WAI-ARIA sortable-table pattern and
-        // is kept in sync by table-filters.js as the sort state changes.
-        for (let i = 0; i < sectionInfo.headers.length; i++) {
-          const type = sectionInfo.colTypes[i];
-          const isStaticColumn = i === 0; // The 'No.' column is static (not sortable).
-
-          const thAttributes = isStaticColumn ? '' : `data-type="${type}" aria-sort="none" `;
-          const headerContent = isStaticColumn
-            ? sectionInfo.headers[i]
-            : `<button type="button" class="th-sort-btn" title="Click to sort"><span class="th-content">${sectionInfo.headers[i]}</span><span class="sort-icon" aria-hidden="true">↕</span></button>`;
-
-          tableContent += `<th ${thAttributes}scope="col" class="py-3 px-4" style="color:var(--t-brand)">${headerContent}</th>`;
-        }
-        tableContent += `</tr></thead><tbody>`;
+        // Table opening and sortable header row, prebuilt per section.
+        tableContent += SECTION_TABLE_HEADS[section];
 
         let counter = 1;
         // Generate table rows, mapping data properties to columns.
@@ -1033,8 +1039,7 @@ ${getBackToTopScript()}
       parser: 'html',
     });
 
-    await fs.writeFile(filePath, formattedContent, 'utf8');
-    console.log(`Written file: ${filePath}`);
+    files.push({ filePath, content: formattedContent });
 
     quarterlyFileLinks.push({
       path: relativePath,
@@ -1042,6 +1047,8 @@ ${getBackToTopScript()}
     });
   }
 
+  await writeFilesConcurrently(files);
+
   return quarterlyFileLinks;
 }
 
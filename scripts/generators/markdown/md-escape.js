@@ -7,9 +7,7 @@
 /** Safe for a table cell or plain bullet text: collapses embedded newlines
  * (which would otherwise split the row/bullet) and escapes `|`. */
 function mdEscapeCell(str) {
-  return String(str || '')
-    .replace(/\r?\n/g, ' ')
-    .replace(/\|/g, '\\|');
+  return String(str || '').replace(/\r?\n|\|/g, (match) => (match === '|' ? '\\|' : ' '));
 }
 
 /** Safe as markdown link text (`[...](url)`): mdEscapeCell, plus guards
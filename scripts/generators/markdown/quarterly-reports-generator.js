@@ -7,7 +7,85 @@ const {
   getIssueOrPrNumber,
   getPrStatusContent,
   getCollaborationStatusContent,
+  sortByDateDesc,
 } = require('../../utils/contribution-formatters');
+const { escapeHtml } = require('../../utils/escape-html');
+const { writeFilesConcurrently } = require('../../utils/file-writer');
+
+// Configuration for each table section, defining headers and data fields.
+// Built once per module rather than once per quarter.
+const SECTIONS = {
+  pullRequests: {
+    title: 'Merged PRs',
+    headers: ['No.', 'Project Name', 'Title', 'Created At', 'Merged At', 'Review Period'],
+    widths: ['5%', '20%', '30%', '15%', '15%', '15%'],
+    keys: ['repo', 'title', 'date', 'mergedAt', 'reviewPeriod'],
+  },
+  issues: {
+    title: 'Issues',
+    headers: ['No.', 'Project Name', 'Title', 'Created At', 'Closed At', 'Closing Period'],
+    widths: ['5%', '25%', '35%', '15%', '15%', '10%'],
+    keys: ['repo', 'title', 'date', 'closedAt', 'closingPeriod'],
+  },
+  reviewedPrs: {
+    title: 'Reviewed PRs',
+    headers: [
+      'No.',
+      'Project Name',
+      'Title',
+      'Created At',
+      'My First Review',
+      'My First Review Period',
+      'Last Update / Status',
+    ],
+    widths: ['5%', '20%', '28%', '10%', '15%', '10%', '14%'],
+    keys: ['repo', 'title', 'createdAt', 'myFirstReviewDate', 'myFirstReviewPeriod', 'date'],
+  },
+  coAuthoredPrs: {
+    title: 'Co-Authored PRs',
+    headers: [
+      'No.',
+      'Project Name',
+      'Title',
+      'Created At',
+      'My First Commit',
+      'My First Commit Period',
+      'Last Update / Status',
+    ],
+    widths: ['5%', '15%', '25%', '10%', '12%', '13%', '20%'],
+    keys: ['repo', 'title', 'createdAt', 'firstCommitDate', 'firstCommitPeriod', 'date'],
+  },
+  collaborations: {
+    title: 'Collaborations',
+    headers: [
+      'No.',
+      'Project Name',
+      'Title',
+      'Created At',
+      'Last Commented At',
+      'Last Update / Status',
+    ],
+    widths: ['5%', '25%', '30%', '12%', '12%', '16%'],
+    keys: ['repo', 'title', 'createdAt', 'date', 'date'],
+  },
+};
+
+// Each section's <thead> block never varies between quarters, so it is
+// rendered once here and reused for every table.
+const TABLE_HEADS = Object.fromEntries(
+  Object.entries(SECTIONS).map(([section, { headers, widths }]) => [
+    section,
+    `<table style='width:100%; table-layout:fixed;'>\n` +
+      `  <thead>\n` +
+      `    <tr>\n` +
+      headers
+        .map((header, i) => `      <th style='width:${widths[i]};'>${header}</th>\n`)
+        .join('') +
+      `    </tr>\n` +
+      `  </thead>\n` +
+      `  <tbody>\n`,
+  ])
+);
 
 /**
  * Helper to render status labels as HTML badges.
@@ -44,19 +122,19 @@ async function writeMarkdownFiles(groupedContributions) {
 
   await fs.mkdir(markdownBaseDir, { recursive: true });
 
+  // Every quarter is rendered first and the files are written together at
+  // the end, so the writes overlap instead of waiting on each other.
+  const files = [];
+
   for (const [key, data] of Object.entries(groupedContributions)) {
     const [year, quarter] = key.split('-');
     const yearDir = path.join(markdownBaseDir, year);
-    await fs.mkdir(yearDir, { recursive: true });
 
     const filePath = path.join(yearDir, `${quarter}-${year}.md`);
+    // Never 0: groupContributionsByQuarter only creates a quarter when it
+    // places an item in it.
     const totalContributions = Object.values(data).reduce((sum, arr) => sum + arr.length, 0);
 
-    if (totalContributions === 0) {
-      console.log(`Skipping empty quarter: ${key}`);
-      continue;
-    }
-
     const allItems = [
       ...data.pullRequests,
       ...data.issues,
@@ -75,9 +153,11 @@ async function writeMarkdownFiles(groupedContributions) {
     const sortedRepos = Object.entries(repoCounts).sort(([, a], [, b]) => b - a);
     const top3Repos = sortedRepos.slice(0, 3);
 
-    let markdownContent = `# ${quarter} ${year}\n`;
+    // Collect fragments and join once at the end rather than growing one
+    // string with += for every cell of every table.
+    const parts = [`# ${quarter} ${year}\n`];
 
-    markdownContent += `
+    parts.push(`
 ## 📊 Quarterly Statistics
 
 * **Total Contributions:** ${totalContributions}
@@ -94,114 +174,44 @@ async function writeMarkdownFiles(groupedContributions) {
 | Collaborations | ${data.collaborations.length} |
 
 ### Top 3 Repositories
-`;
+`);
 
     if (top3Repos.length > 0) {
       top3Repos.forEach((item, index) => {
         // Add the repository URL to the Markdown output
         const repoUrl = `https://github.com/${item[0]}`;
-        markdownContent += `
-${index + 1}. [**${item[0]}**](${repoUrl}) (${item[1]} contributions)`;
+        parts.push(`
+${index + 1}. [**${item[0]}**](${repoUrl}) (${item[1]} contributions)`);
       });
-      markdownContent += `\n`;
+      parts.push(`\n`);
     }
 
     // --- ADD HORIZONTAL BREAK ---
-    markdownContent += `
+    parts.push(`
 ---
 
-`;
-
-    // Configuration for each table section, defining headers and data fields
-    const sections = {
-      pullRequests: {
-        title: 'Merged PRs',
-        headers: ['No.', 'Project Name', 'Title', 'Created At', 'Merged At', 'Review Period'],
-        widths: ['5%', '20%', '30%', '15%', '15%', '15%'],
-        keys: ['repo', 'title', 'date', 'mergedAt', 'reviewPeriod'],
-      },
-      issues: {
-        title: 'Issues',
-        headers: ['No.', 'Project Name', 'Title', 'Created At', 'Closed At', 'Closing Period'],
-        widths: ['5%', '25%', '35%', '15%', '15%', '10%'],
-        keys: ['repo', 'title', 'date', 'closedAt', 'closingPeriod'],
-      },
-      reviewedPrs: {
-        title: 'Reviewed PRs',
-        headers: [
-          'No.',
-          'Project Name',
-          'Title',
-          'Created At',
-          'My First Review',
-          'My First Review Period',
-          'Last Update / Status',
-        ],
-        widths: ['5%', '20%', '28%', '10%', '15%', '10%', '14%'],
-        keys: ['repo', 'title', 'createdAt', 'myFirstReviewDate', 'myFirstReviewPeriod', 'date'],
-      },
-      coAuthoredPrs: {
-        title: 'Co-Authored PRs',
-        headers: [
-          'No.',
-          'Project Name',
-          'Title',
-          'Created At',
-          'My First Commit',
-          'My First Commit Period',
-          'Last Update / Status',
-        ],
-        widths: ['5%', '15%', '25%', '10%', '12%', '13%', '20%'],
-        keys: ['repo', 'title', 'createdAt', 'firstCommitDate', 'firstCommitPeriod', 'date'],
-      },
-      collaborations: {
-        title: 'Collaborations',
-        headers: [
-          'No.',
-          'Project Name',
-          'Title',
-          'Created At',
-          'Last Commented At',
-          'Last Update / Status',
-        ],
-        widths: ['5%', '25%', '30%', '12%', '12%', '16%'],
-        keys: ['repo', 'title', 'createdAt', 'date', 'date'],
-      },
-    };
+`);
 
     // Loop through each contribution type to create a collapsible section.
-    for (const [section, sectionInfo] of Object.entries(sections)) {
+    for (const [section, sectionInfo] of Object.entries(SECTIONS)) {
       let items = data[section];
 
       // Sort reviewed and co-authored PRs by their engagement date (ascending order)
       if (section === 'reviewedPrs' && items && items.length > 0) {
-        items = [...items].sort((a, b) => {
-          return new Date(b.myFirstReviewDate) - new Date(a.myFirstReviewDate);
-        });
+        items = sortByDateDesc(items, 'myFirstReviewDate');
       } else if (section === 'coAuthoredPrs' && items && items.length > 0) {
-        items = [...items].sort((a, b) => {
-          return new Date(b.firstCommitDate) - new Date(a.firstCommitDate);
-        });
+        items = sortByDateDesc(items, 'firstCommitDate');
       }
 
       // Use the HTML <details> tag for a collapsible section
-      markdownContent += `<details>\n`;
-      markdownContent += ` <summary><h2>${sectionInfo.title}</h2></summary>\n`;
+      parts.push(`<details>\n`);
+      parts.push(` <summary><h2>${sectionInfo.title}</h2></summary>\n`);
 
       if (!items || items.length === 0) {
-        markdownContent += `No contribution in this quarter.\n`;
+        parts.push(`No contribution in this quarter.\n`);
       } else {
-        // Build the HTML table as a single string
-        let tableContent = `<table style='width:100%; table-layout:fixed;'>\n`;
-        tableContent += `  <thead>\n`;
-        tableContent += `    <tr>\n`;
-        // Generate table headers with specified width styles
-        for (let i = 0; i < sectionInfo.headers.length; i++) {
-          tableContent += `      <th style='width:${sectionInfo.widths[i]};'>${sectionInfo.headers[i]}</th>\n`;
-        }
-        tableContent += `    </tr>\n`;
-        tableContent += `  </thead>\n`;
-        tableContent += `  <tbody>\n`;
+        // Build the HTML table
+        parts.push(TABLE_HEADS[section]);
 
         let counter = 1;
         // Iterate over each contribution item to build table rows
@@ -209,11 +219,14 @@ ${index + 1}. [**${item[0]}**](${repoUrl}) (${item[1]} contributions)`;
           const issueOrPrNumber = getIssueOrPrNumber(item.url);
           const numberSuffix = issueOrPrNumber ? ` #${issueOrPrNumber}` : '';
 
-          tableContent += `    <tr>\n`;
-          tableContent += `      <td>${counter++}.</td>\n`;
-          tableContent += `      <td>${item.repo}${numberSuffix}</td>\n`;
-          // Add a hyperlink to the title
-          tableContent += `      <td><a href='${item.url}'>${item.title}</a></td>\n`;
+          parts.push(`    <tr>\n`);
+          parts.push(`      <td>${counter++}.</td>\n`);
+          parts.push(`      <td>${escapeHtml(item.repo)}${numberSuffix}</td>\n`);
+          // Add a hyperlink to the title. The table is raw HTML, so a title
+          // containing `<`, `&` or a quote has to be escaped to keep the row intact.
+          parts.push(
+            `      <td><a href='${escapeHtml(item.url)}'>${escapeHtml(item.title)}</a></td>\n`
+          );
 
           // Logic for Merged PRs table structure
           if (section === 'pullRequests') {
@@ -230,22 +243,22 @@ ${index + 1}. [**${item[0]}**](${repoUrl}) (${item[1]} contributions)`;
               ? `<br>${getGitHubStatusBadge('RECORDED')}`
               : '';
 
-            tableContent += `      <td>${createdAt}</td>\n`;
-            tableContent += `      <td>${mergedAt}${statusBadge}</td>\n`;
-            tableContent += `      <td>${reviewPeriod}</td>\n`;
+            parts.push(`      <td>${createdAt}</td>\n`);
+            parts.push(`      <td>${mergedAt}${statusBadge}</td>\n`);
+            parts.push(`      <td>${reviewPeriod}</td>\n`);
             // Logic for Issues table structure
           } else if (section === 'issues') {
             const createdAt = formatDate(item.date);
             const closedAt = formatDate(item.closedAt);
 
-            tableContent += `      <td>${createdAt}</td>\n`;
-            tableContent += `      <td>${closedAt}</td>\n`;
+            parts.push(`      <td>${createdAt}</td>\n`);
+            parts.push(`      <td>${closedAt}</td>\n`);
 
             if (item.closedAt) {
               const closingPeriod = calculatePeriodInDays(item.date, item.closedAt);
-              tableContent += `      <td>${closingPeriod}</td>\n`;
+              parts.push(`      <td>${closingPeriod}</td>\n`);
             } else {
-              tableContent += `      <td>${getGitHubStatusBadge('OPEN')}</td>\n`;
+              parts.push(`      <td>${getGitHubStatusBadge('OPEN')}</td>\n`);
             }
             // Logic for Reviewed PRs table structure
           } else if (section === 'reviewedPrs') {
@@ -265,10 +278,10 @@ ${index + 1}. [**${item[0]}**](${repoUrl}) (${item[1]} contributions)`;
             const cleanStatusLabel = rawStatusTag.replace(/<\/?strong>/g, '');
             const finalStatusBadge = getGitHubStatusBadge(cleanStatusLabel.toUpperCase());
 
-            tableContent += `      <td>${createdAt}</td>\n`;
-            tableContent += `      <td>${myFirstReviewAt}</td>\n`;
-            tableContent += `      <td>${myFirstReviewPeriod}</td>\n`;
-            tableContent += `      <td>${lastUpdatedString}<br>${finalStatusBadge}</td>\n`;
+            parts.push(`      <td>${createdAt}</td>\n`);
+            parts.push(`      <td>${myFirstReviewAt}</td>\n`);
+            parts.push(`      <td>${myFirstReviewPeriod}</td>\n`);
+            parts.push(`      <td>${lastUpdatedString}<br>${finalStatusBadge}</td>\n`);
             // Logic for Co-Authored PRs table structure
           } else if (section === 'coAuthoredPrs') {
             const createdAt = formatDate(item.createdAt);
@@ -284,10 +297,10 @@ ${index + 1}. [**${item[0]}**](${repoUrl}) (${item[1]} contributions)`;
             const cleanStatusLabel = rawStatusTag.replace(/<\/?strong>/g, '');
             const finalStatusBadge = getGitHubStatusBadge(cleanStatusLabel.toUpperCase());
 
-            tableContent += `      <td>${createdAt}</td>\n`;
-            tableContent += `      <td>${firstCommitAt}</td>\n`;
-            tableContent += `      <td>${firstCommitPeriod}</td>\n`;
-            tableContent += `      <td>${lastUpdatedString}<br>${finalStatusBadge}</td>\n`;
+            parts.push(`      <td>${createdAt}</td>\n`);
+            parts.push(`      <td>${firstCommitAt}</td>\n`);
+            parts.push(`      <td>${firstCommitPeriod}</td>\n`);
+            parts.push(`      <td>${lastUpdatedString}<br>${finalStatusBadge}</td>\n`);
             // Logic for Collaborations table structure
           } else if (section === 'collaborations') {
             const createdAt = formatDate(item.createdAt);
@@ -302,28 +315,25 @@ ${index + 1}. [**${item[0]}**](${repoUrl}) (${item[1]} contributions)`;
             const cleanStatusLabel = rawStatusTag.replace(/<\/?strong>/g, '');
             const finalStatusBadge = getGitHubStatusBadge(cleanStatusLabel.toUpperCase());
 
-            tableContent += `      <td>${createdAt}</td>\n`;
-            tableContent += `      <td>${commentedAt}</td>\n`;
-            tableContent += `      <td>${lastUpdatedString}<br>${finalStatusBadge}</td>\n`;
+            parts.push(`      <td>${createdAt}</td>\n`);
+            parts.push(`      <td>${commentedAt}</td>\n`);
+            parts.push(`      <td>${lastUpdatedString}<br>${finalStatusBadge}</td>\n`);
           }
 
-          tableContent += `    </tr>\n`;
+          parts.push(`    </tr>\n`);
         }
 
-        tableContent += `  </tbody>\n`;
-        tableContent += `</table>\n`;
-
-        // Add the finished table string to the markdown content
-        markdownContent += tableContent;
+        parts.push(`  </tbody>\n`);
+        parts.push(`</table>\n`);
       }
 
-      markdownContent += `</details>\n\n`;
+      parts.push(`</details>\n\n`);
     }
 
-    // Write the final Markdown content to the file.
-    await fs.writeFile(filePath, markdownContent, 'utf8');
-    console.log(`Written file: ${filePath}`);
+    files.push({ filePath, content: parts.join('') });
   }
+
+  await writeFilesConcurrently(files);
 }
 
 module.exports = {
@@ -31,6 +31,8 @@ const { fetchTrackerTitleInfo } = require('../api/fetch-tracker-titles');
 const TRACKER_RAW_URL =
   'https://raw.githubusercontent.com/adiati98/mautic-docs-prs-tracker/main/data/pr-cache.json';
 const TRACKER_CACHE_FILE = path.join('data', 'tracker-cache.json');
+// ETag and fetch time of TRACKER_CACHE_FILE (see fetchTrackerFeed).
+const TRACKER_META_FILE = path.join('data', 'tracker-cache-meta.json');
 
 const STALLED_AFTER_DAYS = 30;
 const REMIND_AFTER_DAYS = 7;
@@ -59,47 +61,84 @@ function isValidTrackerShape(data) {
   );
 }
 
-async function readTrackerCacheFile() {
+async function readJsonFile(file) {
   try {
-    const raw = await fs.readFile(TRACKER_CACHE_FILE, 'utf8');
-    const parsed = JSON.parse(raw);
-    if (parsed && isValidTrackerShape(parsed.data)) return parsed;
+    return JSON.parse(await fs.readFile(file, 'utf8'));
   } catch (e) {
-    /* no usable cache */
+    return null;
   }
-  return null;
+}
+
+async function readTrackerCacheFile(cacheFile) {
+  const parsed = await readJsonFile(cacheFile);
+  return parsed && isValidTrackerShape(parsed.data) ? parsed : null;
 }
 
 /**
  * Fetches the tracker feed with full degradation:
  *   live fetch OK  → { data, fetchedAt, degraded: false }
+ *   304 (unchanged)→ cached copy, degraded: false
  *   fetch fails    → last cached copy, degraded: true, reason
  *   no cache       → empty feed, degraded: true, reason
+ *
+ * The feed is large and usually unchanged between daily runs, so its ETag is
+ * sent as If-None-Match and a 304 reuses the cached copy instead of
+ * re-downloading the whole file. The ETag and fetch time live in a small
+ * side file: revalidating never has to read the ~1 MB cache, and a 200 is the
+ * only case that rewrites it.
  */
-async function fetchTrackerFeed({ url = TRACKER_RAW_URL, timeoutMs = 10000 } = {}) {
+async function fetchTrackerFeed({
+  url = TRACKER_RAW_URL,
+  timeoutMs = 10000,
+  cacheFile = TRACKER_CACHE_FILE,
+  metaFile = TRACKER_META_FILE,
+} = {}) {
+  const meta = await readJsonFile(metaFile);
+  const get = (etag) =>
+    axios.get(url, {
+      timeout: timeoutMs,
+      responseType: 'json',
+      headers: etag ? { 'If-None-Match': etag } : {},
+      validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+    });
   try {
-    const res = await axios.get(url, { timeout: timeoutMs, responseType: 'json' });
-    if (!isValidTrackerShape(res.data)) {
+    let res = await get(meta?.etag);
+    let data = res.data;
+    if (res.status === 304) {
+      const cached = await readTrackerCacheFile(cacheFile);
+      if (cached) {
+        data = cached.data;
+      } else {
+        // The side file outlived the feed it describes, so there's nothing
+        // to revalidate; fetch the feed unconditionally instead.
+        res = await get(null);
+        data = res.data;
+      }
+    }
+    if (!isValidTrackerShape(data)) {
       throw new Error('tracker feed shape changed (schema drift)');
     }
-    const feed = { data: res.data, fetchedAt: new Date().toISOString(), degraded: false, reason: null };
+    const changed = res.status !== 304;
+    const etag = changed ? res.headers.etag || null : meta.etag;
+    const feed = { data, fetchedAt: new Date().toISOString(), degraded: false, reason: null };
     try {
-      await fs.mkdir(path.dirname(TRACKER_CACHE_FILE), { recursive: true });
-      await fs.writeFile(
-        TRACKER_CACHE_FILE,
-        JSON.stringify({ fetchedAt: feed.fetchedAt, data: res.data }),
-        'utf8'
-      );
+      await fs.mkdir(path.dirname(cacheFile), { recursive: true });
+      // The side file is only written once the feed it describes is on disk,
+      // so its ETag can never vouch for a cache that failed to save.
+      if (changed) {
+        await fs.writeFile(cacheFile, JSON.stringify({ fetchedAt: feed.fetchedAt, data }), 'utf8');
+      }
+      await fs.writeFile(metaFile, JSON.stringify({ fetchedAt: feed.fetchedAt, etag }), 'utf8');
     } catch (e) {
       /* cache write is best-effort */
     }
     return feed;
   } catch (err) {
-    const cached = await readTrackerCacheFile();
+    const cached = await readTrackerCacheFile(cacheFile);
     if (cached) {
       return {
         data: cached.data,
-        fetchedAt: cached.fetchedAt || null,
+        fetchedAt: meta?.fetchedAt || cached.fetchedAt || null,
         degraded: true,
         reason: `live fetch failed (${err.message}); using cached feed`,
       };
@@ -3,7 +3,12 @@
  * derivation in the design blueprint §05. Run: node scripts/services/workbench-merge.test.js
  */
 const assert = require('assert');
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const axios = require('axios');
 const {
+  fetchTrackerFeed,
   mergeWorkbench,
   computeImpact,
   isValidTrackerShape,
@@ -1130,8 +1135,57 @@ run(
   console.log('  ok  UTC1 · month/quarter boundaries are UTC, not runner-local');
 }
 
-if (process.exitCode) {
-  console.error('\nfixture run FAILED');
-} else {
-  console.log('\nall workbench-merge fixtures passed');
+// ===========================================================================
+// Tracker feed cache
+// ===========================================================================
+
+// TC1. The committed cache is pretty-printed by `npm run format`, so it must
+// be read back by parsing rather than by assuming the layout it was written
+// with: a 304 reuses it as-is, and a failed fetch degrades to it.
+async function trackerCacheFixtures() {
+  const dir = fs.mkdtempSync(path.join(os.tmpdir(), 'tracker-cache-'));
+  const cacheFile = path.join(dir, 'tracker-cache.json');
+  const metaFile = path.join(dir, 'tracker-cache-meta.json');
+  const data = { 'mautic/docs#1': { docsUpdatedAt: daysAgo(1), rawDocsReviews: [] } };
+  const prettyCache = JSON.stringify({ fetchedAt: daysAgo(2), data }, null, 2) + '\n';
+  fs.writeFileSync(cacheFile, prettyCache);
+  fs.writeFileSync(metaFile, JSON.stringify({ fetchedAt: daysAgo(1), etag: 'W/"v1"' }, null, 2));
+
+  const originalGet = axios.get;
+  try {
+    let sentEtag;
+    axios.get = async (url, config) => {
+      sentEtag = config.headers['If-None-Match'];
+      return { status: 304, data: '', headers: {} };
+    };
+    const revalidated = await fetchTrackerFeed({ cacheFile, metaFile });
+    assert.equal(sentEtag, 'W/"v1"', 'the ETag comes from the side file');
+    assert.equal(revalidated.degraded, false);
+    assert.deepEqual(revalidated.data, data, 'a 304 reuses the pretty-printed cache');
+    assert.equal(fs.readFileSync(cacheFile, 'utf8'), prettyCache, 'a 304 never rewrites the feed');
+    assert.equal(JSON.parse(fs.readFileSync(metaFile, 'utf8')).etag, 'W/"v1"');
+
+    axios.get = async () => {
+      throw new Error('offline');
+    };
+    const degraded = await fetchTrackerFeed({ cacheFile, metaFile });
+    assert.equal(degraded.degraded, true);
+    assert.deepEqual(degraded.data, data, 'a failed fetch falls back to the cache');
+    assert.equal(degraded.fetchedAt, revalidated.fetchedAt, 'fetchedAt is the last revalidation');
+    console.log('  ok  TC1 · pretty-printed tracker cache is read back on 304 and on failure');
+  } catch (e) {
+    console.error(`FAIL  TC1 · tracker cache read-back: ${e.message}`);
+    process.exitCode = 1;
+  } finally {
+    axios.get = originalGet;
+    fs.rmSync(dir, { recursive: true, force: true });
+  }
 }
+
+trackerCacheFixtures().then(() => {
+  if (process.exitCode) {
+    console.error('\nfixture run FAILED');
+  } else {
+    console.log('\nall workbench-merge fixtures passed');
+  }
+});
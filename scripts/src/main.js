@@ -29,6 +29,7 @@ const { loadFailedFetchCache, persistFailedFetchCache } = require('../utils/fail
 
 // Import grouping logic
 const { groupContributionsByQuarter } = require('../utils/contributions-groupers');
+const { sortByDateDesc } = require('../utils/contribution-formatters');
 
 // Import markdown generation logic
 const { writeMarkdownFiles } = require('../generators/markdown/quarterly-reports-generator');
@@ -72,6 +73,7 @@ async function main() {
   const failedFetchFile = path.join(dataDir, 'failed-fetch.json');
   const cacheFile = path.join(dataDir, 'pr-cache.json');
   const dataFile = path.join(dataDir, 'all-contributions.json');
+  const fetchStateFile = path.join(dataDir, 'fetch-state.json');
   const articlesFile = path.join(dataDir, 'all-articles.json');
   const ongoingTasksFile = path.join(dataDir, 'ongoing-tasks.json');
   const ongoingIssuesFile = path.join(dataDir, 'ongoing-issues.json');
@@ -143,6 +145,27 @@ async function main() {
     }
   }
 
+  // Load persistent ETag cache for the historical crawler's per-PR reviews and
+  // comments lookups. Each entry keeps only the ETag and the derived value
+  // (e.g. the user's first comment date), so unchanged PRs revalidate with a
+  // 304 that costs no rate limit instead of re-downloading their threads.
+  const etagCacheFile = path.join(dataDir, 'etag-cache.json');
+  const etagCache = new Map();
+  try {
+    const etagCacheData = await fs.readFile(etagCacheFile, 'utf8');
+    const parsed = JSON.parse(etagCacheData);
+    for (const [k, v] of Object.entries(parsed)) {
+      etagCache.set(k, v);
+    }
+    console.log('Loaded ETag cache from file.');
+  } catch (e) {
+    if (e.code !== 'ENOENT') {
+      console.error('Failed to load ETag cache:', e);
+    } else {
+      console.log('No persistent ETag cache found, starting fresh.');
+    }
+  }
+
   let hasFailed = false;
   try {
     // --- Fetch Ongoing Pull Requests (Submitted by you) ---
@@ -263,6 +286,24 @@ async function main() {
     const lastUpdate = cacheStats ? new Date(cacheStats.mtime) : null;
     const today = new Date();
 
+    // The last calendar year that has been crawled at least once AFTER it
+    // ended. Such a year is frozen: its searches can't return anything new,
+    // so all-contributions.json already holds its final state and daily runs
+    // skip it entirely. Unlike the data file's mtime (which on CI is always
+    // the checkout time, so it can't tell a closed year from an open one),
+    // this survives a fresh clone. Full resyncs ignore it and re-crawl all.
+    let frozenThroughYear = null;
+    try {
+      const fetchState = JSON.parse(await fs.readFile(fetchStateFile, 'utf8'));
+      if (Number.isInteger(fetchState.frozenThroughYear)) {
+        frozenThroughYear = fetchState.frozenThroughYear;
+      }
+    } catch (e) {
+      if (e.code !== 'ENOENT') {
+        console.error('Failed to load fetch state:', e);
+      }
+    }
+
     let fetchStartYear;
 
     if (isFullResync) {
@@ -271,6 +312,13 @@ async function main() {
     } else if (!lastUpdate) {
       fetchStartYear = undefined;
       console.log('First run - triggering auto-discovery of GitHub join date');
+    } else if (frozenThroughYear !== null) {
+      // Normally just the current year; in January, the year that just ended
+      // also gets one final crawl before it freezes.
+      fetchStartYear = Math.min(frozenThroughYear + 1, today.getFullYear());
+      console.log(
+        `Years through ${frozenThroughYear} are frozen - fetching from: ${fetchStartYear}`
+      );
     } else {
       const lastUpdateYear = lastUpdate.getFullYear();
       const lastUpdateMonth = lastUpdate.getMonth();
@@ -301,7 +349,13 @@ async function main() {
     }
 
     const { contributions: newContributions, rejectedCoAuthorUrls: historicalRejectedUrls } =
-      await fetchContributions(fetchStartYear, prCache, mergedCommitCache, failedFetchCache);
+      await fetchContributions(
+        fetchStartYear,
+        prCache,
+        mergedCommitCache,
+        failedFetchCache,
+        etagCache
+      );
 
     let finalContributions = {
       pullRequests: [],
@@ -316,6 +370,7 @@ async function main() {
     );
 
     const globalLoadedBy = new Map();
+    const higherTier = new Set(['reviewedPrs', 'coAuthoredPrs']);
 
     const categoryOrder = Object.keys(finalContributions);
     for (const type of categoryOrder) {
@@ -330,7 +385,6 @@ async function main() {
             continue;
           }
 
-          const higherTier = new Set(['reviewedPrs', 'coAuthoredPrs']);
           const currentIsHigher = higherTier.has(type);
 
           if (currentIsHigher) {
@@ -397,13 +451,30 @@ async function main() {
 
     console.log('Merging newly fetched contributions (enforcing category hierarchy).');
 
+    // Position of each URL's first entry per category, so matching a fetched
+    // item to its existing entry is a lookup rather than a scan of the whole
+    // category. Collaborations superseded by a higher tier are only marked
+    // here and dropped after the loop, which keeps the indexes valid.
+    const indexByUrl = {};
+    for (const type of Object.keys(finalContributions)) {
+      indexByUrl[type] = new Map();
+      finalContributions[type].forEach((item, index) => {
+        if (!indexByUrl[type].has(item.url)) indexByUrl[type].set(item.url, index);
+      });
+    }
+    const supersededCollaborations = new Set();
+    const pushEntry = (type, item) => {
+      const index = finalContributions[type].push(item) - 1;
+      if (!indexByUrl[type].has(item.url)) indexByUrl[type].set(item.url, index);
+    };
+
     for (const type of Object.keys(newContributions)) {
       if (Array.isArray(newContributions[type])) {
         for (const item of newContributions[type]) {
           const url = item.url;
 
-          const existingIndex = finalContributions[type].findIndex((i) => i.url === url);
-          if (existingIndex !== -1) {
+          const existingIndex = indexByUrl[type].get(url);
+          if (existingIndex !== undefined) {
             finalContributions[type][existingIndex] = item;
             const s = globalLoadedBy.get(url) || new Set();
             s.add(type);
@@ -413,25 +484,22 @@ async function main() {
 
           const seen = globalLoadedBy.get(url);
           if (!seen) {
-            finalContributions[type].push(item);
+            pushEntry(type, item);
             globalLoadedBy.set(url, new Set([type]));
             continue;
           }
 
-          const higherTier = new Set(['reviewedPrs', 'coAuthoredPrs']);
           const currentIsHigher = higherTier.has(type);
           const existingInHigher = Array.from(seen).filter((c) => higherTier.has(c));
 
           if (currentIsHigher) {
-            const lowerToRemove = ['collaborations'];
-            for (const lowerCat of lowerToRemove) {
-              const idx = finalContributions[lowerCat].findIndex((i) => i.url === url);
-              if (idx !== -1) {
-                finalContributions[lowerCat].splice(idx, 1);
-              }
+            const collaborationIndex = indexByUrl.collaborations.get(url);
+            if (collaborationIndex !== undefined) {
+              supersededCollaborations.add(collaborationIndex);
+              indexByUrl.collaborations.delete(url);
             }
 
-            finalContributions[type].push(item);
+            pushEntry(type, item);
             if (existingInHigher.length > 0) {
               for (const higherCat of existingInHigher) {
                 seen.add(higherCat);
@@ -441,7 +509,7 @@ async function main() {
             globalLoadedBy.set(url, seen);
           } else {
             if (existingInHigher.length === 0) {
-              finalContributions[type].push(item);
+              pushEntry(type, item);
               seen.add(type);
               globalLoadedBy.set(url, seen);
             }
@@ -450,8 +518,14 @@ async function main() {
       }
     }
 
+    if (supersededCollaborations.size > 0) {
+      finalContributions.collaborations = finalContributions.collaborations.filter(
+        (_, index) => !supersededCollaborations.has(index)
+      );
+    }
+
     for (const type of Object.keys(finalContributions)) {
-      finalContributions[type].sort((a, b) => new Date(b.date) - new Date(a.date));
+      finalContributions[type] = sortByDateDesc(finalContributions[type], 'date');
     }
 
     console.log('Merged and categorized all contributions based on latest status.');
@@ -459,6 +533,20 @@ async function main() {
     await fs.writeFile(dataFile, JSON.stringify(finalContributions, null, 2), 'utf8');
     console.log('Updated contributions data saved to file.');
 
+    // Every year before the current one that this run crawled is now closed
+    // and saved above, so it can be frozen. Written only after the data file,
+    // so a run that fails earlier never freezes a year it didn't persist.
+    const lastClosedYear = today.getFullYear() - 1;
+    const crawledClosedYears = fetchStartYear === undefined || fetchStartYear <= lastClosedYear;
+    if (crawledClosedYears && frozenThroughYear !== lastClosedYear) {
+      await fs.writeFile(
+        fetchStateFile,
+        JSON.stringify({ frozenThroughYear: lastClosedYear }, null, 2),
+        'utf8'
+      );
+      console.log(`Froze contribution history through ${lastClosedYear}.`);
+    }
+
     // --- Quarterly grouping, and Markdown and HTML generator functions ---
     const grouped = groupContributionsByQuarter(finalContributions);
 
@@ -569,6 +657,17 @@ async function main() {
       console.error('Failed to persist workbench activity cache:', e);
     }
 
+    try {
+      const obj = {};
+      for (const [k, v] of etagCache) {
+        obj[k] = v;
+      }
+      await fs.writeFile(etagCacheFile, JSON.stringify(obj, null, 2), 'utf8');
+      console.log('Persisted ETag cache to file.');
+    } catch (e) {
+      console.error('Failed to persist ETag cache:', e);
+    }
+
     try {
       await persistFailedFetchCache(failedFetchFile, failedFetchCache);
       console.log('Persisted failed-fetch cache to file.');
@@ -13,6 +13,7 @@ const { spawnSync } = require('child_process');
  */
 const cacheFiles = [
   'commit-cache.json',
+  'etag-cache.json',
   'pr-cache.json',
   'failed-fetch.json',
   'workbench-activity-cache.json',
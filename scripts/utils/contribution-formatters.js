@@ -2,6 +2,25 @@
  * Utility functions for formatting dates, calculating periods, and generating status strings.
  */
 
+// GitHub timestamps are fixed-width UTC ("2024-03-05T10:00:00Z"), so their
+// calendar fields can be sliced out directly instead of going through Date.
+const ISO_UTC_PATTERN = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z$/;
+
+/**
+ * Returns the UTC year and month (1-12) of a date string, or null if it
+ * can't be parsed.
+ * @param {string} dateString ISO 8601 date string.
+ * @returns {{year: number, month: number} | null}
+ */
+function getUtcYearMonth(dateString) {
+  if (typeof dateString === 'string' && ISO_UTC_PATTERN.test(dateString)) {
+    return { year: Number(dateString.slice(0, 4)), month: Number(dateString.slice(5, 7)) };
+  }
+  const date = new Date(dateString);
+  if (Number.isNaN(date.getTime())) return null;
+  return { year: date.getUTCFullYear(), month: date.getUTCMonth() + 1 };
+}
+
 /**
  * Formats an ISO 8601 date string to YYYY-MM-DD format.
  * @param {string} dateString ISO 8601 date string.
@@ -9,6 +28,9 @@
  */
 function formatDate(dateString) {
   if (!dateString) return 'N/A';
+  if (typeof dateString === 'string' && ISO_UTC_PATTERN.test(dateString)) {
+    return dateString.slice(0, 10);
+  }
   try {
     return new Date(dateString).toISOString().split('T')[0];
   } catch (e) {
@@ -17,6 +39,20 @@ function formatDate(dateString) {
   }
 }
 
+/**
+ * Returns a copy of `items` sorted newest first by `item[field]`. Each date is
+ * parsed once up front rather than twice per comparison.
+ * @param {object[]} items
+ * @param {string} field Name of the date field to sort on.
+ * @returns {object[]}
+ */
+function sortByDateDesc(items, field) {
+  return items
+    .map((item) => ({ item, time: new Date(item[field]).getTime() }))
+    .sort((a, b) => b.time - a.time)
+    .map(({ item }) => item);
+}
+
 /**
  * Calculates the number of days between two dates.
  * @param {string} startDateString ISO 8601 start date.
@@ -94,7 +130,9 @@ function getCollaborationStatusContent(item) {
 }
 
 module.exports = {
+  getUtcYearMonth,
   formatDate,
+  sortByDateDesc,
   calculatePeriodInDays,
   getIssueOrPrNumber,
   getPrStatusContent,
@@ -1,5 +1,6 @@
 const fs = require('fs');
 const path = require('path');
+const { getUtcYearMonth } = require('./contribution-formatters');
 
 /**
  * Processes a list of contributions and groups them into calendar quarters (YYYY-QX).
@@ -12,23 +13,21 @@ function groupContributionsByQuarter(contributions) {
   // Normalized set of every URL we could already categorize, so a 403 that is
   // ALSO present as a real row isn't shown twice (once as itself, once as a
   // ghost). Matches the normalization used for the headline count in main.js.
+  // Filled in during the placement pass below; ghost rows are only injected
+  // after it has seen every item.
   const categorizedUrls = new Set();
-  for (const items of Object.values(contributions)) {
-    if (!Array.isArray(items)) continue;
-    for (const item of items) {
-      if (item?.url) categorizedUrls.add(item.url.replace(/\/$/, '').toLowerCase());
-    }
-  }
 
   /**
-   * Places one item into its quarter bucket.
+   * Places one item into its quarter bucket. This is the only place a quarter
+   * key is created, so every quarter in the result holds at least one item.
    */
   function placeInQuarter(type, item, dateStr) {
-    const dateObj = new Date(dateStr);
-    const year = dateObj.getFullYear();
-    const month = dateObj.getMonth() + 1;
-    const quarter = `Q${Math.floor((month - 1) / 3) + 1}`;
-    const key = `${year}-${quarter}`;
+    const parts = getUtcYearMonth(dateStr);
+    if (!parts) {
+      console.warn(`Skipping item in ${type} due to unparseable date:`, item.title);
+      return;
+    }
+    const key = `${parts.year}-Q${Math.floor((parts.month - 1) / 3) + 1}`;
 
     if (!grouped[key]) {
       grouped[key] = {
@@ -47,7 +46,10 @@ function groupContributionsByQuarter(contributions) {
   }
 
   for (const [type, items] of Object.entries(contributions)) {
+    if (!Array.isArray(items)) continue;
     for (const item of items) {
+      if (item?.url) categorizedUrls.add(item.url.replace(/\/$/, '').toLowerCase());
+
       let dateStr;
 
       if (type === 'reviewedPrs' && item.myFirstReviewDate) {
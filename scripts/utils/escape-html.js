@@ -6,16 +6,20 @@
  * labels, article titles, feed error text, repo names) must go through
  * this before they land in a template literal.
  */
+const HTML_ESCAPES = {
+  '&': '&amp;',
+  '<': '&lt;',
+  '>': '&gt;',
+  '"': '&quot;',
+  "'": '&#39;',
+};
+
 function escapeHtml(str) {
   if (str === null || str === undefined) return '';
   if (typeof str !== 'string') return String(str);
 
-  return str
-    .replace(/&/g, '&amp;')
-    .replace(/</g, '&lt;')
-    .replace(/>/g, '&gt;')
-    .replace(/"/g, '&quot;')
-    .replace(/'/g, '&#39;');
+  // One scan with a lookup instead of five chained replace passes.
+  return str.replace(/[&<>"']/g, (ch) => HTML_ESCAPES[ch]);
 }
 
 module.exports = { escapeHtml };
@@ -0,0 +1,21 @@
+const fs = require('fs/promises');
+const path = require('path');
+
+/**
+ * Writes a batch of generated files at once, so the writes overlap instead of
+ * each one waiting for the previous file to land. Every distinct parent
+ * directory is created first, then all the files are written together.
+ * @param {{ filePath: string, content: string }[]} files The files to write.
+ */
+async function writeFilesConcurrently(files) {
+  const dirs = new Set(files.map(({ filePath }) => path.dirname(filePath)));
+  await Promise.all([...dirs].map((dir) => fs.mkdir(dir, { recursive: true })));
+  await Promise.all(
+    files.map(async ({ filePath, content }) => {
+      await fs.writeFile(filePath, content, 'utf8');
+      console.log(`Written file: ${filePath}`);
+    })
+  );
+}
+
+module.exports = { writeFilesConcurrently };
@@ -15,6 +15,29 @@ function getLinkedIssueNumbers(prBody) {
   return matches;
 }
 
+const repositoryUrlCache = new Map();
+
+/**
+ * HELPER: Splits a search result's `repository_url`
+ * ("https://api.github.com/repos/{owner}/{repo}") into owner and repo.
+ * The URL always has this fixed shape, so the last two segments are sliced
+ * off the end instead of building a URL object per item. Most items share a
+ * handful of repos, so each distinct URL is only split once per process.
+ */
+function parseRepositoryUrl(repositoryUrl) {
+  let parsed = repositoryUrlCache.get(repositoryUrl);
+  if (!parsed) {
+    const repoStart = repositoryUrl.lastIndexOf('/');
+    const ownerStart = repositoryUrl.lastIndexOf('/', repoStart - 1);
+    parsed = Object.freeze({
+      owner: repositoryUrl.slice(ownerStart + 1, repoStart),
+      repo: repositoryUrl.slice(repoStart + 1),
+    });
+    repositoryUrlCache.set(repositoryUrl, parsed);
+  }
+  return parsed;
+}
+
 /** Extracts a linked code-PR reference from a docs PR body, if present. */
 function extractLinkedCodePr(body, ownRepo) {
   if (!body) return null;
@@ -218,6 +241,7 @@ async function getPrActivityMeta(
 
 module.exports = {
   getLinkedIssueNumbers,
+  parseRepositoryUrl,
   extractLinkedCodePr,
   getPrActivityMeta,
 };
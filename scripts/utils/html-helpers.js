@@ -3,18 +3,22 @@
  * @param {string} str - The string to sanitize.
  * @returns {string} The sanitized string.
  */
+const ATTRIBUTE_ESCAPES = {
+  '&': '&amp;',
+  '"': '&quot;',
+  "'": '&#39;',
+  '`': '&#96;',
+  '<': '&lt;',
+  '>': '&gt;',
+};
+
 function sanitizeAttribute(str) {
   if (str === null || str === undefined) return ''; // Return empty string instead of null/undefined
   if (typeof str !== 'string') return String(str); // Convert numbers/booleans to string
 
   return str
     .trim() // Remove unnecessary whitespace
-    .replace(/&/g, '&amp;')
-    .replace(/"/g, '&quot;')
-    .replace(/'/g, '&#39;')
-    .replace(/`/g, '&#96;')
-    .replace(/</g, '&lt;')
-    .replace(/>/g, '&gt;');
+    .replace(/[&"'`<>]/g, (ch) => ATTRIBUTE_ESCAPES[ch]); // Single pass over the string
 }
 
 module.exports = {
@@ -7,6 +7,7 @@
  */
 
 const https = require('https');
+const axios = require('axios');
 
 const MAX_RATE_LIMIT_RETRIES = 6;
 
@@ -50,8 +51,17 @@ function isRetryableNetworkError(err) {
 //      requests queue at the socket layer. Set to 6 as a hard ceiling that
 //      matches the workbench's PR_CONCURRENCY of 3 and keeps the total
 //      simultaneous-connection count well under GitHub's abuse threshold.
+//
+// Used on the default HTTP/1.1 path — see createGitHubClient.
 const keepAliveAgent = new https.Agent({ keepAlive: true, maxSockets: 6 });
 
+// GITHUB_HTTP2=true opts every GitHub client into HTTP/2. It stays opt-in
+// until it's confirmed that axios's HTTP/2 transport follows redirects the
+// way the HTTP/1.1 path (via follow-redirects) does: GitHub answers requests
+// for a renamed repo with a 301, and fetch-tracker-titles builds repo paths
+// from docs PR bodies that can still name the old one.
+const USE_HTTP2 = process.env.GITHUB_HTTP2 === 'true';
+
 let rateLimitLogged = false;
 
 /**
@@ -83,6 +93,98 @@ function attachRateLimitLogger(axiosInstance) {
   return axiosInstance;
 }
 
+/**
+ * Builds the axios instance every GitHub API fetcher uses, so they share one
+ * transport configuration instead of each repeating it. By default requests
+ * go over HTTP/1.1 through keepAliveAgent, whose maxSockets caps open
+ * connections. With GITHUB_HTTP2=true they go over HTTP/2 instead: the per-PR
+ * fan-out becomes streams multiplexed on one TLS connection, with the session
+ * held open long enough to span pagination pauses and short backoffs. Nothing
+ * at the socket layer caps that path, so bounded concurrency (PR_CONCURRENCY
+ * and friends) is the only limit on requests in flight. The rate-limit
+ * logger and pacer are attached.
+ */
+function createGitHubClient({ baseURL, token, timeout = 30000 }) {
+  const transport = USE_HTTP2
+    ? { httpVersion: 2, http2Options: { sessionTimeout: 30000 } }
+    : { httpsAgent: keepAliveAgent };
+  const client = axios.create({
+    baseURL,
+    timeout,
+    ...transport,
+    headers: {
+      ...(token ? { Authorization: `token ${token}` } : {}),
+      Accept: 'application/vnd.github.v3+json',
+    },
+  });
+  return attachRateLimitPacer(attachRateLimitLogger(client));
+}
+
+// Latest primary-quota snapshot per rate-limit resource (core, search,
+// graphql, ...), taken from the x-ratelimit-* headers of the most recent
+// response for that resource: { remaining, resetMs }.
+const rateLimitState = new Map();
+
+// Once a resource is down to this many requests, the pacer holds new requests
+// until its window resets instead of spending the rest and eating a 403. A few
+// spare absorbs the requests already in flight under bounded concurrency.
+const RATE_LIMIT_FLOOR = 5;
+
+function rateLimitResourceFor(url = '') {
+  if (url.includes('/search/')) return 'search';
+  if (url.includes('/graphql')) return 'graphql';
+  return 'core';
+}
+
+function recordRateLimit(response) {
+  const headers = response?.headers;
+  const remaining = Number(headers?.['x-ratelimit-remaining']);
+  const reset = Number(headers?.['x-ratelimit-reset']);
+  if (!Number.isFinite(remaining) || !Number.isFinite(reset)) return;
+  rateLimitState.set(headers['x-ratelimit-resource'] || 'core', {
+    remaining,
+    resetMs: reset * 1000,
+  });
+}
+
+/**
+ * Attaches interceptors that pace requests against GitHub's primary rate
+ * limit: every response (including error responses) updates the quota
+ * snapshot for its resource, and a request whose resource is at or below
+ * RATE_LIMIT_FLOOR waits until that resource's `x-ratelimit-reset` before
+ * going out. Waiting out the reset up front costs exactly the time GitHub
+ * asks for, where hitting the wall costs a failed request plus a backoff
+ * guess in withRateLimitRetry.
+ */
+function attachRateLimitPacer(axiosInstance) {
+  axiosInstance.interceptors.request.use(async (config) => {
+    const resource = rateLimitResourceFor(config.url);
+    const state = rateLimitState.get(resource);
+    if (state && state.remaining <= RATE_LIMIT_FLOOR) {
+      const waitMs = state.resetMs - Date.now() + 1000;
+      if (waitMs > 0) {
+        console.log(
+          `[rate-limit] ${state.remaining} ${resource} requests left, pausing ${Math.round(waitMs / 1000)}s until the window resets...`
+        );
+        await new Promise((resolve) => setTimeout(resolve, waitMs));
+      }
+      rateLimitState.delete(resource);
+    }
+    return config;
+  });
+  axiosInstance.interceptors.response.use(
+    (response) => {
+      recordRateLimit(response);
+      return response;
+    },
+    (err) => {
+      recordRateLimit(err.response);
+      return Promise.reject(err);
+    }
+  );
+  return axiosInstance;
+}
+
 // How many extra tries to give a 403 that carries no rate-limit signal at
 // all (no retry-after, quota not at 0) before concluding it's not a rate
 // limit — just an access restriction on that specific repo (e.g. an org
@@ -92,25 +194,33 @@ function attachRateLimitLogger(axiosInstance) {
 const UNCONFIRMED_403_RETRIES = 1;
 
 /**
- * A 403 with a `retry-after` header, or with `x-ratelimit-remaining: 0`, is
- * GitHub telling us to slow down — worth waiting out. A 403 with neither
- * signal present isn't a rate limit at all; it's a permission problem.
+ * A 403/429 with a `retry-after` header, or with `x-ratelimit-remaining: 0`,
+ * is GitHub telling us to slow down — worth waiting out, for exactly as long
+ * as it says: `retry-after` seconds, or until `x-ratelimit-reset` when the
+ * quota is spent. A 403 with neither signal present isn't a rate limit at
+ * all; it's a permission problem.
  */
-function classify403(err) {
+function classifyRateLimit(err) {
   const headers = err.response?.headers || {};
   const retryAfter = Number(headers['retry-after']);
   const remaining = Number(headers['x-ratelimit-remaining']);
+  const reset = Number(headers['x-ratelimit-reset']);
   const hasRetryAfter = Number.isFinite(retryAfter) && retryAfter > 0;
   const isQuotaExhausted = Number.isFinite(remaining) && remaining === 0;
-  return {
-    isConfirmedRateLimit: hasRetryAfter || isQuotaExhausted,
-    retryAfterMs: hasRetryAfter ? retryAfter * 1000 : null,
-  };
+
+  let retryAfterMs = null;
+  if (hasRetryAfter) {
+    retryAfterMs = retryAfter * 1000;
+  } else if (isQuotaExhausted && Number.isFinite(reset)) {
+    retryAfterMs = Math.max(0, reset * 1000 - Date.now()) + 1000;
+  }
+  return { isConfirmedRateLimit: hasRetryAfter || isQuotaExhausted, retryAfterMs };
 }
 
 /**
  * Runs `fn` (an async function performing one axios call) with backoff retry
- * on a confirmed 403 rate limit and on transient 502/503/504 server errors.
+ * on a confirmed 403 rate limit, any 429, and transient 502/503/504 server
+ * errors.
  * A 403 that carries no rate-limit signal gets one quick retry (to rule out
  * a fluke) and is then thrown with `isPermanent403` set, so callers can
  * record it and stop re-attempting it on future runs instead of burning the
@@ -139,15 +249,16 @@ async function withRateLimitRetry(
     } catch (err) {
       const status = err.response?.status;
 
-      if (status === 403) {
-        const { isConfirmedRateLimit, retryAfterMs } = classify403(err);
+      if (status === 403 || status === 429) {
+        const { isConfirmedRateLimit, retryAfterMs } = classifyRateLimit(err);
 
-        if (assumeRateLimit || isConfirmedRateLimit) {
+        // A 429 is always a rate limit, whatever headers it carries.
+        if (status === 429 || assumeRateLimit || isConfirmedRateLimit) {
           if (attempt >= retries) throw err;
           attempt++;
           const delay = retryAfterMs ?? Math.min(60000, 2000 * 2 ** (attempt - 1));
           console.log(
-            `[retry] rate-limit (403) on ${label || 'request'} (attempt ${attempt}/${retries}), backing off ${Math.round(delay / 1000)}s...`
+            `[retry] rate-limit (${status}) on ${label || 'request'} (attempt ${attempt}/${retries}), backing off ${Math.round(delay / 1000)}s...`
           );
           await new Promise((resolve) => setTimeout(resolve, delay));
           continue;
@@ -201,6 +312,70 @@ async function withRateLimitRetry(
   }
 }
 
+/**
+ * Returns the `rel="next"` URL from a GitHub response's Link header, or null
+ * on the last page. Pagination loops follow this URL as given instead of
+ * counting `page` up themselves, so they stop exactly where GitHub says the
+ * results end and keep working for endpoints that page by cursor.
+ */
+function getNextPageUrl(response) {
+  const link = response?.headers?.link;
+  if (!link) return null;
+  const match = link.match(/<([^>]+)>;\s*rel="next"/);
+  return match ? match[1] : null;
+}
+
+/**
+ * GETs `url` as a conditional request against a persistent ETag cache (a Map
+ * of url → { etag, value }). `derive(response)` reduces the body to the small
+ * value the caller actually needs, and only that value is stored next to the
+ * ETag — raw bodies would bloat the data/ caches committed after every run.
+ * A 304 Not Modified, which GitHub doesn't count against the rate limit,
+ * returns the stored value without re-downloading or re-deriving anything.
+ * `retryOptions` is passed straight through to withRateLimitRetry.
+ */
+async function getWithEtag(axiosInstance, url, etagCache, derive, retryOptions = {}) {
+  const cached = etagCache?.get(url);
+  const response = await withRateLimitRetry(
+    () =>
+      axiosInstance.get(url, {
+        headers: cached?.etag ? { 'If-None-Match': cached.etag } : {},
+        validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+      }),
+    retryOptions
+  );
+  if (response.status === 304 && cached) return cached.value;
+
+  const value = derive(response);
+  const etag = response.headers.etag;
+  if (etagCache && etag) etagCache.set(url, { etag, value });
+  return value;
+}
+
+/**
+ * POSTs a query to GitHub's GraphQL (v4) endpoint through the given axios
+ * instance, so it shares the REST calls' token, agent, and retry policy.
+ *
+ * GraphQL reports most failures as a 200 with an `errors` array, often next to
+ * partial `data` — a batched query can have one aliased field fail (e.g. a repo
+ * in an SSO-gated org) while every other field resolves. Only the caller knows
+ * which alias maps to which item, so `errors` is returned rather than thrown.
+ * A response with no `data` at all (e.g. the GraphQL quota is exhausted) is
+ * thrown, since nothing in it is usable.
+ */
+async function postGraphql(axiosInstance, query, variables = {}, { label = 'graphql' } = {}) {
+  const response = await withRateLimitRetry(
+    () => axiosInstance.post('/graphql', { query, variables }),
+    { label }
+  );
+  const { data, errors } = response.data || {};
+  if (!data) {
+    const reason = errors?.map((e) => e.message).join('; ') || 'empty response';
+    throw new Error(`GraphQL ${label} failed: ${reason}`);
+  }
+  return { data, errors: errors || [] };
+}
+
 /**
  * Runs `items` through `iteratee` with bounded concurrency, processing in
  * chunks so we never have more than `concurrency` requests in-flight —
@@ -222,7 +397,11 @@ async function mapWithConcurrency(items, concurrency, iteratee) {
 module.exports = {
   MAX_RATE_LIMIT_RETRIES,
   attachRateLimitLogger,
+  createGitHubClient,
   withRateLimitRetry,
+  getNextPageUrl,
+  getWithEtag,
+  postGraphql,
   mapWithConcurrency,
   keepAliveAgent,
 };